@@ -1,73 +1,153 @@
 """
 Configuration settings for the Audio Transcription Application.
+
+Settings are immutable dataclasses grouped under one Settings tree.
+Use get_settings() to obtain it: the .env file and environment are
+read on the first call only and the same instance is returned after.
 """
+import functools
 import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Tuple
+
 from dotenv import load_dotenv
 
-load_dotenv()
+
+# .env lives next to this module; resolving it directly avoids
+# python-dotenv's upward directory search
+ENV_PATH = Path(__file__).with_name(".env")
+_env_stat: Optional[Tuple[int, int]] = None  # (mtime_ns, size) last loaded
+
+
+def _load_env_file():
+    """Load ENV_PATH unless it is missing or unchanged since last load."""
+    global _env_stat
+    try:
+        st = ENV_PATH.stat()
+    except OSError:
+        return
+    stat_key = (st.st_mtime_ns, st.st_size)
+    if stat_key != _env_stat:
+        load_dotenv(ENV_PATH, override=False)
+        _env_stat = stat_key
 
 
 # Audio Recording Settings
+@dataclass(frozen=True, slots=True)
 class AudioSettings:
     """Audio recording and processing configuration."""
     # Chunk duration: shorter = more real-time, longer = better accuracy
-    CHUNK_DURATION = 5.0  # seconds
-    SAMPLE_RATE = 16000  # Hz - 16kHz for Azure Speech Service
-    CHUNK_SIZE = 1024  # Audio buffer size
-    MIN_AUDIO_LENGTH = 1000  # Minimum audio bytes to attempt transcription
+    chunk_duration: float = 5.0  # seconds
+    sample_rate: int = 16000  # Hz - 16kHz for Azure Speech Service
+    chunk_size: int = 1024  # Audio buffer size
+    min_audio_length: int = 1000  # Min audio bytes to attempt transcription
+
+
+# Audio settings do not come from the environment, so they are also
+# exposed as plain module constants for audio loops
+_AUDIO_DEFAULTS = AudioSettings()
+CHUNK_DURATION = _AUDIO_DEFAULTS.chunk_duration
+SAMPLE_RATE = _AUDIO_DEFAULTS.sample_rate
+CHUNK_SIZE = _AUDIO_DEFAULTS.chunk_size
 
 
 # Voice Activity Detection Settings
+@dataclass(frozen=True, slots=True)
 class VADSettings:
     """Voice Activity Detection configuration."""
-    AGGRESSIVENESS = 3  # 0-3, higher = more aggressive filtering
-    FRAME_DURATION_MS = 30  # Frame duration in milliseconds (10, 20, or 30)
-    MIN_SPEECH_DURATION = 0.5  # Minimum speech duration in seconds
+    aggressiveness: int = 3  # 0-3, higher = more aggressive filtering
+    frame_duration_ms: int = 30  # Frame duration in ms (10, 20, or 30)
+    min_speech_duration: float = 0.5  # Minimum speech duration in seconds
 
 
 # Logging Settings
+@dataclass(frozen=True, slots=True)
 class LogSettings:
     """Logging and output configuration."""
     # Main transcription log file (configurable via environment variable)
     # Note: Logger will create timestamped files in logs/ folder
-    LOG_FILE = os.getenv("TRANSCRIPTION_LOG_FILE", "transcriptions.log")
+    log_file: str = "transcriptions.log"
     # Show intermediate/partial results as user speaks
-    SHOW_INTERIM_RESULTS = True
+    show_interim_results: bool = True
 
 
 # Session Settings
+@dataclass(frozen=True, slots=True)
 class SessionSettings:
     """Session management configuration."""
     # Auto-pause after silence (seconds)
-    AUTO_PAUSE_SILENCE_DURATION = 60  # 1 minute of silence
+    auto_pause_silence_duration: int = 60  # 1 minute of silence
     # Enable auto-pause feature
-    ENABLE_AUTO_PAUSE = True
+    enable_auto_pause: bool = True
 
 
 # Azure OpenAI Settings (legacy - not currently used)
+@dataclass(frozen=True, slots=True)
 class AzureOpenAI:
     """Azure OpenAI API configuration (for future LLM integration)."""
-    AZURE_OPENAI_ENDPOINT = os.getenv("AZURE_OPENAI_ENDPOINT")
-    AZURE_OPENAI_API_KEY = os.getenv("AZURE_OPENAI_API_KEY")
-    OPENAI_API_VERSION = "2025-01-01-preview"
-    MODEL_NAME = "gpt-4.1-2025-04-14"
+    endpoint: Optional[str] = None
+    api_key: Optional[str] = None
+    api_version: str = "2025-01-01-preview"
+    model_name: str = "gpt-4.1-2025-04-14"
 
 
+@dataclass(frozen=True, slots=True)
 class AzureSpeechService:
     """Azure Speech Service configuration."""
-    AZURE_SPEECH_SERVICE_KEY = os.getenv("AZURE_SPEECH_SERVICE_KEY")
-    AZURE_SPEECH_SERVICE_REGION = os.getenv("AZURE_SPEECH_SERVICE_REGION")
+    key: Optional[str] = None
+    region: Optional[str] = None
     
     # Language configuration
     # Options: "en-US", "ru-RU", "tr-TR", "auto" (auto-detect)
-    SPEECH_LANGUAGE = os.getenv("SPEECH_LANGUAGE", "auto")
+    speech_language: str = "auto"
     
     # For auto-detection, list candidate languages
     # More languages = slower but more accurate detection
-    CANDIDATE_LANGUAGES = ["en-US", "ru-RU", "tr-TR"]
+    candidate_languages: Tuple[str, ...] = ("en-US", "ru-RU", "tr-TR")
     
     # Enable speaker diarization (identify different speakers)
-    ENABLE_DIARIZATION = True
+    enable_diarization: bool = True
     # Number of expected speakers (None = auto-detect)
-    MIN_SPEAKERS = 2
-    MAX_SPEAKERS = 10
+    min_speakers: Optional[int] = 2
+    max_speakers: Optional[int] = 10
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """All application settings."""
+    audio: AudioSettings = field(default_factory=AudioSettings)
+    vad: VADSettings = field(default_factory=VADSettings)
+    log: LogSettings = field(default_factory=LogSettings)
+    session: SessionSettings = field(default_factory=SessionSettings)
+    openai: AzureOpenAI = field(default_factory=AzureOpenAI)
+    azure: AzureSpeechService = field(default_factory=AzureSpeechService)
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Build the application settings from .env and the environment.
+
+    Runs once per process; later calls return the cached instance.
+
+    Returns:
+        Immutable Settings tree
+    """
+    _load_env_file()
+    env = os.environ.get
+
+    return Settings(
+        log=LogSettings(
+            log_file=env("TRANSCRIPTION_LOG_FILE", "transcriptions.log")
+        ),
+        openai=AzureOpenAI(
+            endpoint=env("AZURE_OPENAI_ENDPOINT"),
+            api_key=env("AZURE_OPENAI_API_KEY"),
+        ),
+        azure=AzureSpeechService(
+            key=env("AZURE_SPEECH_SERVICE_KEY"),
+            region=env("AZURE_SPEECH_SERVICE_REGION"),
+            speech_language=env("SPEECH_LANGUAGE", "auto"),
+        ),
+    )
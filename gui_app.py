@@ -21,23 +21,123 @@ from PyQt6.QtWidgets import (
     QMessageBox, QTabWidget, QScrollArea, QFrame, QSplitter, QListWidget,
     QListWidgetItem, QDateEdit, QLineEdit
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QObject, QTimer, QDate
-from PyQt6.QtGui import QFont, QTextCursor, QColor, QIcon, QMovie, QPixmap
-from services.speech_engine.azure_speech_service import AzureSpeechTranscriber
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QObject, QTimer, QDate, QRunnable, QThreadPool
+)
+from PyQt6.QtGui import (
+    QFont, QTextCursor, QColor, QIcon, QMovie, QPixmap, QTextCharFormat
+)
+from services.speech_engine.azure_speech_service import (
+    AzureSpeechTranscriber, install_queue_logging, preload_sdk
+)
 from services.speech_engine.stt.transcription_logger import TranscriptionLogger
-from config import AudioSettings, LogSettings, SessionSettings
+from config import CHUNK_SIZE, SAMPLE_RATE, get_settings
 from services.audio.audio_recorder import AudioRecorder
 from services.speech_engine.tts.translation_tts_controller import TranslationTTSController
 from services.llm.meeting_assistant_service import MeetingAssistantService
 from services.llm import llm_service
-from services.llm import prompts
-from queue import Queue, Empty
+from services.llm.translation_batch import (
+    TRANSLATION_BATCH_SIZE, translate_texts
+)
+from queue import Queue, SimpleQueue, Empty
 from services.audio.audio_mixer import start_mixer, stop_mixer
 from pathlib import Path
 import json
+from collections import deque
 from services.llm.private_chat_service import PrivateChatService
 
 
+# Rule drawn above every final result
+FINAL_SEPARATOR = '─' * 80 + '\n'
+
+# Text pane stylesheets
+STYLE_INTERIM = "background-color: #FFFACD; color: #000000;"
+STYLE_FINAL = "background-color: #E0FFE0; color: #000000;"
+STYLE_TRANSLATION = "background-color: #E0F0FF; color: #000000;"
+STYLE_CHAT_HISTORY = (
+    "background-color: #F5F5F5; color: #000000; padding: 10px;"
+)
+_INSIGHT_STYLE = (
+    "background-color: %s; color: %s; padding: 10px; font-weight: 500;"
+)
+STYLE_KEY_POINTS = _INSIGHT_STYLE % ("#E8F5E9", "#1B5E20")
+STYLE_DECISIONS = _INSIGHT_STYLE % ("#FFF3E0", "#BF360C")
+STYLE_ACTION_ITEMS = _INSIGHT_STYLE % ("#E3F2FD", "#01579B")
+STYLE_QUESTIONS = _INSIGHT_STYLE % ("#F3E5F5", "#4A148C")
+
+# One translation entry: timestamp, source icon, source, speaker, text
+_XLAT_TPL = (
+    '<span style="color: #0066CC;">[%s] [%s %s]%s </span>'
+    '<span style="color: #9932CC;">%s</span><br>'
+)
+
+# Capture callbacks deliver this many CHUNK_SIZE blocks at a time;
+# larger buffers mean fewer PortAudio callbacks and push-stream writes
+CAPTURE_BUFFER_CHUNKS = 2
+
+# Final/translation HTML is flushed to the text panes at most this often
+TEXT_FLUSH_INTERVAL_MS = 60
+TEXT_BUFFER_LIMIT = 200  # Pending entries kept if the GUI falls behind
+
+# On close, wait at most this long for a running translation job
+TRANSLATION_SHUTDOWN_WAIT_MS = 500
+
+# Echo duplicate detection keeps at most this many normalized texts per
+# source before expired ones are pruned
+RECENT_NORM_LIMIT = 64
+
+
+# Whitespace and punctuation ignored when comparing transcripts
+_NORM_TABLE = str.maketrans("", "", " .,?!;:\n\r\t")
+
+
+# Characters that must be escaped in text inserted as HTML
+_HTML_ESCAPES = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+
+def escape_html(text: str) -> str:
+    """
+    Escape text for insertion into HTML (like html.escape(quote=False)).
+    
+    Transcripts rarely contain markup characters, so text without
+    "&" or "<" is returned as is.
+    """
+    if "&" not in text and "<" not in text:
+        return text
+    return text.translate(_HTML_ESCAPES)
+
+
+def normalize_for_dedup(text: str) -> str:
+    """Normalize a transcript for MIC/SYSTEM echo comparison."""
+    return text.casefold().translate(_NORM_TABLE)
+
+
+def char_format(color: str, bold: bool = False) -> QTextCharFormat:
+    """Build a character format with the given color and weight."""
+    fmt = QTextCharFormat()
+    fmt.setForeground(QColor(color))
+    if bold:
+        fmt.setFontWeight(QFont.Weight.Bold)
+    return fmt
+
+
+def prune_recent(recent: dict, now: float, max_age: float = 10.0):
+    """
+    Drop entries older than max_age from a normalized-text index.
+    Only scans once the index outgrows RECENT_NORM_LIMIT, so the cost
+    is amortized over many inserts.
+    
+    Args:
+        recent: Mapping of normalized text -> last seen time
+        now: Current time (time.time())
+        max_age: Age in seconds after which entries expire
+    """
+    if len(recent) > RECENT_NORM_LIMIT:
+        for key, seen_at in list(recent.items()):
+            if now - seen_at >= max_age:
+                del recent[key]
+
+
 class SignalEmitter(QObject):
     """Signal emitter for thread-safe GUI updates."""
     append_interim = pyqtSignal(str, str, str)
@@ -58,6 +158,23 @@ class SignalEmitter(QObject):
     set_api_status = pyqtSignal(str)  # API operation status
 
 
+class TranslationJob(QRunnable):
+    """Runs one translation drain pass on a QThreadPool thread."""
+    
+    def __init__(self, drain):
+        """
+        Initialize translation job.
+        
+        Args:
+            drain: Callable that translates queued items until none remain
+        """
+        super().__init__()
+        self._drain = drain
+    
+    def run(self):
+        self._drain()
+
+
 class TranscriptionGUI(QMainWindow):
     def __init__(self):
         """Initialize the GUI application."""
@@ -81,29 +198,47 @@ class TranscriptionGUI(QMainWindow):
         self.session_folder = None
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_timer)
+        self._last_timer_str = "⏱️ 00:00:00"  # Text shown by timer_label
         self.last_speech_time = None
         self.auto_pause_timer = QTimer()
         self.auto_pause_timer.timeout.connect(self.check_auto_pause)
         
         # Feature 1: Text Translation
         self.text_translation_enabled = False
-        self.translation_queue = Queue()
-        self.translation_worker_running = False
+        self.translation_queue = SimpleQueue()
+        self.translation_worker_running = False  # Translations allowed
+        # Queued items are drained by a pool job that exists only while
+        # there is work; one thread keeps translations in order
+        self.translation_pool = QThreadPool(self)
+        self.translation_pool.setMaxThreadCount(1)
+        self._translation_job_active = False
+        self._translation_job_lock = threading.Lock()
+        # Selected target languages, mirrored from the combo boxes so the
+        # worker thread never queries Qt widgets
+        self._text_xlat_lang = "English"
+        self._tts_lang = "English"
         
         # Feature 2: TTS to Microphone
         self.tts_to_mic_enabled = False
         self.tts_enabled_at = 0.0  # Timestamp when TTS was enabled
-        self.seen_before_tts = set()  # Text hashes seen before TTS enabled
+        # Normalized texts seen before TTS was enabled
+        self.seen_before_tts = set()
         self.tts_controller = TranslationTTSController()
         self.tts_controller.on_state_change = self.on_tts_state_change
         
         # Duplicate detection (bidirectional: MIC↔SYSTEM)
-        self.recent_mic_transcriptions = []  # [(text, timestamp), ...]
-        self.recent_sys_transcriptions = []  # [(text, timestamp), ...]
+        # Oldest first: deque([(text, timestamp), ...])
+        self.recent_mic_transcriptions = deque()
+        self.recent_sys_transcriptions = deque()
+        # Same texts indexed by normalized form: {normalized: timestamp}
+        self._recent_mic_norm = {}
+        self._recent_sys_norm = {}
         self.duplicate_window_seconds = 3.0  # Time window for duplicates
+        self._timestamp_cache = (0, "")  # (epoch second, formatted)
         
         # Translation tracking (to identify SYSTEM texts as translations)
-        self.queued_for_translation = []  # [(text, timestamp), ...]
+        # [(normalized text, timestamp), ...]
+        self.queued_for_translation = deque()
         self.translation_window_seconds = 30.0  # Max time
         
         # Audio Mixer (for routing mic + TTS to virtual device)
@@ -121,11 +256,11 @@ class TranscriptionGUI(QMainWindow):
         self.translation_error_count = 0
         
         # Audio settings
-        self.sample_rate = AudioSettings.SAMPLE_RATE
-        self.chunk_size = AudioSettings.CHUNK_SIZE
+        self.sample_rate = SAMPLE_RATE
+        self.chunk_size = CHUNK_SIZE
         
         # Logger
-        self.logger = TranscriptionLogger(log_file=LogSettings.LOG_FILE)
+        self.logger = TranscriptionLogger(log_file=get_settings().log.log_file)
         
         # Meeting Assistant Service for AI insights
         self.meeting_assistant = MeetingAssistantService()
@@ -144,6 +279,30 @@ class TranscriptionGUI(QMainWindow):
         self.chat_queue = Queue()
         self.chat_worker_running = False
         
+        # Final result styles, applied with QTextCursor.insertText so
+        # entries bypass Qt's HTML parser
+        self._fmt_separator = char_format("#999999")
+        self._fmt_timestamp = char_format("#999999")
+        self._fmt_speaker = char_format("#CC0066", bold=True)
+        self._fmt_source = char_format("#666666")
+        self._fmt_text = char_format("#000000")
+        
+        # Warnings received since the last text flush (latest message)
+        self._pending_warning = None
+        self._pending_warning_count = 0
+        
+        # Interim label HTML by (source, speaker_id)
+        self._interim_prefix = {}
+        
+        # Final/translation entries waiting for the next text flush
+        # (finals as (text, format) runs, translations as HTML)
+        self._final_buf = deque(maxlen=TEXT_BUFFER_LIMIT)
+        self._xlat_buf = deque(maxlen=TEXT_BUFFER_LIMIT)
+        self.text_flush_timer = QTimer()
+        self.text_flush_timer.setSingleShot(True)
+        self.text_flush_timer.setInterval(TEXT_FLUSH_INTERVAL_MS)
+        self.text_flush_timer.timeout.connect(self._flush_text_buffers)
+        
         # Signal emitter for thread-safe updates
         self.signals = SignalEmitter()
         self.signals.append_interim.connect(self.append_interim)
@@ -151,7 +310,7 @@ class TranscriptionGUI(QMainWindow):
         self.signals.append_translation.connect(self.append_translation)
         self.signals.update_status.connect(self.update_status)
         self.signals.update_speak_button.connect(self.update_speak_button)
-        self.signals.show_warning.connect(self.show_warning)
+        self.signals.show_warning.connect(self.queue_warning)
         self.signals.clear_warning.connect(self.clear_warning)
         self.signals.append_insight.connect(self.append_insight_to_display)
         self.signals.update_insights_display.connect(self.update_insights_display)
@@ -169,6 +328,11 @@ class TranscriptionGUI(QMainWindow):
         self.setWindowTitle("🎤 Meeting Transcription Assistant")
         self.setGeometry(100, 100, 1400, 900)
         
+        # Fonts shared by the text panes (QFont needs the QApplication,
+        # so they are built here rather than at import)
+        self._mono_font = QFont("Courier", 10)
+        self._insight_font = QFont("Arial", 11)
+        
         # Central widget
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -259,6 +423,9 @@ class TranscriptionGUI(QMainWindow):
         self.text_translation_language.addItems([
             "English", "Russian", "Turkish"
         ])
+        self.text_translation_language.currentTextChanged.connect(
+            self.on_text_translation_language_changed
+        )
         lang_layout.addWidget(self.text_translation_language)
         speech_to_text_layout.addLayout(lang_layout)
         
@@ -313,10 +480,8 @@ class TranscriptionGUI(QMainWindow):
         
         self.interim_text = QTextEdit()
         self.interim_text.setReadOnly(True)
-        self.interim_text.setFont(QFont("Courier", 10))
-        self.interim_text.setStyleSheet(
-            "background-color: #FFFACD; color: #000000;"
-        )
+        self.interim_text.setFont(self._mono_font)
+        self.interim_text.setStyleSheet(STYLE_INTERIM)
         # Set fixed height for single row
         self.interim_text.setMaximumHeight(50)
         interim_layout.addWidget(self.interim_text)
@@ -332,12 +497,10 @@ class TranscriptionGUI(QMainWindow):
         
         self.final_text = QTextEdit()
         self.final_text.setReadOnly(True)
-        self.final_text.setFont(QFont("Courier", 10))
+        self.final_text.setFont(self._mono_font)
         # Minimum height for main content area
         self.final_text.setMinimumHeight(300)
-        self.final_text.setStyleSheet(
-            "background-color: #E0FFE0; color: #000000;"
-        )
+        self.final_text.setStyleSheet(STYLE_FINAL)
         final_layout.addWidget(self.final_text)
         
         final_group.setLayout(final_layout)
@@ -350,11 +513,9 @@ class TranscriptionGUI(QMainWindow):
         
         self.translation_text = QTextEdit()
         self.translation_text.setReadOnly(True)
-        self.translation_text.setFont(QFont("Courier", 10))
+        self.translation_text.setFont(self._mono_font)
         self.translation_text.setMaximumHeight(80)  # 2 rows height
-        self.translation_text.setStyleSheet(
-            "background-color: #E0F0FF; color: #000000;"
-        )
+        self.translation_text.setStyleSheet(STYLE_TRANSLATION)
         translation_result_layout.addWidget(self.translation_text)
         
         self.translation_group.setLayout(translation_result_layout)
@@ -518,10 +679,8 @@ class TranscriptionGUI(QMainWindow):
         key_points_layout = QVBoxLayout()
         self.key_points_text = QTextEdit()
         self.key_points_text.setReadOnly(True)
-        self.key_points_text.setFont(QFont("Arial", 11))
-        self.key_points_text.setStyleSheet(
-            "background-color: #E8F5E9; color: #1B5E20; padding: 10px; font-weight: 500;"
-        )
+        self.key_points_text.setFont(self._insight_font)
+        self.key_points_text.setStyleSheet(STYLE_KEY_POINTS)
         self.key_points_text.setPlaceholderText("Key points will appear here as the AI identifies them...")
         key_points_layout.addWidget(self.key_points_text)
         key_points_group.setLayout(key_points_layout)
@@ -532,10 +691,8 @@ class TranscriptionGUI(QMainWindow):
         decisions_layout = QVBoxLayout()
         self.decisions_text = QTextEdit()
         self.decisions_text.setReadOnly(True)
-        self.decisions_text.setFont(QFont("Arial", 11))
-        self.decisions_text.setStyleSheet(
-            "background-color: #FFF3E0; color: #BF360C; padding: 10px; font-weight: 500;"
-        )
+        self.decisions_text.setFont(self._insight_font)
+        self.decisions_text.setStyleSheet(STYLE_DECISIONS)
         self.decisions_text.setPlaceholderText("Decisions made during the meeting will appear here...")
         decisions_layout.addWidget(self.decisions_text)
         decisions_group.setLayout(decisions_layout)
@@ -546,10 +703,8 @@ class TranscriptionGUI(QMainWindow):
         action_items_layout = QVBoxLayout()
         self.action_items_text = QTextEdit()
         self.action_items_text.setReadOnly(True)
-        self.action_items_text.setFont(QFont("Arial", 11))
-        self.action_items_text.setStyleSheet(
-            "background-color: #E3F2FD; color: #01579B; padding: 10px; font-weight: 500;"
-        )
+        self.action_items_text.setFont(self._insight_font)
+        self.action_items_text.setStyleSheet(STYLE_ACTION_ITEMS)
         self.action_items_text.setPlaceholderText("Action items and tasks will appear here...")
         action_items_layout.addWidget(self.action_items_text)
         action_items_group.setLayout(action_items_layout)
@@ -560,10 +715,8 @@ class TranscriptionGUI(QMainWindow):
         questions_layout = QVBoxLayout()
         self.questions_text = QTextEdit()
         self.questions_text.setReadOnly(True)
-        self.questions_text.setFont(QFont("Arial", 11))
-        self.questions_text.setStyleSheet(
-            "background-color: #F3E5F5; color: #4A148C; padding: 10px; font-weight: 500;"
-        )
+        self.questions_text.setFont(self._insight_font)
+        self.questions_text.setStyleSheet(STYLE_QUESTIONS)
         self.questions_text.setPlaceholderText("AI-suggested follow-up questions will appear here...")
         questions_layout.addWidget(self.questions_text)
         questions_group.setLayout(questions_layout)
@@ -588,11 +741,9 @@ class TranscriptionGUI(QMainWindow):
         # Chat history display
         self.chat_history_text = QTextEdit()
         self.chat_history_text.setReadOnly(True)
-        self.chat_history_text.setFont(QFont("Courier", 10))
+        self.chat_history_text.setFont(self._mono_font)
         self.chat_history_text.setMaximumHeight(80)  # 2 rows height
-        self.chat_history_text.setStyleSheet(
-            "background-color: #F5F5F5; color: #000000; padding: 10px;"
-        )
+        self.chat_history_text.setStyleSheet(STYLE_CHAT_HISTORY)
         self.chat_history_text.setPlaceholderText(
             "💬 Ask questions about the meeting transcript...\n\n"
             "Start transcription to enable chat."
@@ -993,21 +1144,27 @@ class TranscriptionGUI(QMainWindow):
                 self.signals.append_insight.emit("question", question)
     
     def append_interim(self, text: str, source: str, speaker_id: str):
-        """Append text to interim results window."""
-        self.interim_text.clear()
-        
-        if speaker_id:
-            self.interim_text.insertHtml(
-                f'<span style="color: #0066CC; font-weight: bold;">'
-                f'[{speaker_id}]</span> '
-            )
-        if source:
-            self.interim_text.insertHtml(
-                f'<span style="color: #666666;">[{source}]</span> '
-            )
+        """Replace interim results window content with the latest text."""
+        # Speaker/source labels only change between utterances, so their
+        # HTML is built once per (source, speaker_id)
+        key = (source, speaker_id)
+        prefix = self._interim_prefix.get(key)
+        if prefix is None:
+            prefix = ''
+            if speaker_id:
+                prefix += (
+                    f'<span style="color: #0066CC; font-weight: bold;">'
+                    f'[{escape_html(speaker_id)}]</span> '
+                )
+            if source:
+                prefix += (
+                    f'<span style="color: #666666;">'
+                    f'[{escape_html(source)}]</span> '
+                )
+            self._interim_prefix[key] = prefix
         
-        self.interim_text.insertPlainText(text)
-        self.interim_text.moveCursor(QTextCursor.MoveOperation.End)
+        # One document replacement per event
+        self.interim_text.setHtml(prefix + escape_html(text))
     
     def append_final(
         self, text: str, source: str, speaker_id: str, timestamp: str
@@ -1016,38 +1173,66 @@ class TranscriptionGUI(QMainWindow):
         # Clear interim results since text is now final
         self.interim_text.clear()
         
-        # Add separator
-        self.final_text.insertHtml(
-            '<span style="color: #999999;">'
-            + '─' * 80 + '</span><br>'
-        )
+        # Build the whole entry; it is inserted on the next text flush
+        # Separator
+        runs = [(FINAL_SEPARATOR, self._fmt_separator)]
         
-        # Add timestamp
+        # Timestamp
         if timestamp:
-            self.final_text.insertHtml(
-                f'<span style="color: #999999;">⏰ {timestamp}</span><br>'
-            )
+            runs.append((f'⏰ {timestamp}\n', self._fmt_timestamp))
         
-        # Add speaker
+        # Speaker
         if speaker_id:
-            self.final_text.insertHtml(
-                f'<span style="color: #CC0066; font-weight: bold;">'
-                f'👤 {speaker_id}</span> '
-            )
+            runs.append((f'👤 {speaker_id} ', self._fmt_speaker))
         
-        # Add source
+        # Source
         if source:
-            self.final_text.insertHtml(
-                f'<span style="color: #666666;">| {source}</span><br>'
-            )
+            runs.append((f'| {source}\n', self._fmt_source))
         
-        # Add text
-        self.final_text.insertHtml(
-            f'<span style="color: #000000;">💬 {text}</span><br><br>'
-        )
+        # Text
+        runs.append((f'💬 {text}\n\n', self._fmt_text))
         
-        # Auto-scroll to bottom
-        self.final_text.moveCursor(QTextCursor.MoveOperation.End)
+        self._final_buf.append(runs)
+        self._schedule_text_flush()
+    
+    def _schedule_text_flush(self):
+        """Start the flush timer unless a flush is already pending."""
+        if not self.text_flush_timer.isActive():
+            self.text_flush_timer.start()
+    
+    def _flush_text_buffers(self):
+        """
+        Insert all final and translation entries queued since the last
+        flush, one edit per pane, so bursts of results cause a single
+        relayout and repaint.
+        """
+        if self._final_buf:
+            cursor = self.final_text.textCursor()
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            cursor.beginEditBlock()
+            for runs in self._final_buf:
+                for run_text, fmt in runs:
+                    cursor.insertText(run_text, fmt)
+            cursor.endEditBlock()
+            self._final_buf.clear()
+            # Auto-scroll to bottom
+            self.final_text.moveCursor(QTextCursor.MoveOperation.End)
+        
+        if self._xlat_buf:
+            entries = ''.join(self._xlat_buf)
+            self._xlat_buf.clear()
+            self.translation_text.moveCursor(QTextCursor.MoveOperation.End)
+            self.translation_text.insertHtml(entries)
+            # Auto-scroll to bottom
+            scrollbar = self.translation_text.verticalScrollBar()
+            scrollbar.setValue(scrollbar.maximum())
+        
+        if self._pending_warning_count:
+            self.show_warning(
+                self._pending_warning, self._pending_warning_count
+            )
+            self._pending_warning = None
+            self._pending_warning_count = 0
     
     def clear_interim(self):
         """Clear interim results window."""
@@ -1055,6 +1240,7 @@ class TranscriptionGUI(QMainWindow):
     
     def clear_final(self):
         """Clear final results window."""
+        self._final_buf.clear()
         self.final_text.clear()
     
     def toggle_text_translation(self, state):
@@ -1118,29 +1304,21 @@ class TranscriptionGUI(QMainWindow):
             
             # Save all recent transcriptions as "seen before TTS"
             # Include both MIC and SYSTEM texts + items already queued
-            for text, _ in self.recent_mic_transcriptions:
-                text_hash = text.lower().strip().replace(" ", "")
-                self.seen_before_tts.add(text_hash)
-            for text, _ in self.recent_sys_transcriptions:
-                text_hash = text.lower().strip().replace(" ", "")
-                self.seen_before_tts.add(text_hash)
-            # Also mark any texts that were queued for translation
-            for text, _ in self.queued_for_translation:
-                text_hash = text.lower().strip().replace(" ", "")
-                self.seen_before_tts.add(text_hash)
+            # (tuple() snapshots: callback threads may append meanwhile)
+            for text, _ in tuple(self.recent_mic_transcriptions):
+                self.seen_before_tts.add(normalize_for_dedup(text))
+            for text, _ in tuple(self.recent_sys_transcriptions):
+                self.seen_before_tts.add(normalize_for_dedup(text))
+            # Also mark any texts that were queued (already normalized)
+            for text_normalized, _ in tuple(self.queued_for_translation):
+                self.seen_before_tts.add(text_normalized)
             
             print(f"🗑️ Marked {len(self.seen_before_tts)} old texts to skip")
             
             # Start translation worker if not running
             if not self.translation_worker_running:
-                self.translation_worker_running = True
-                import threading
-                worker_thread = threading.Thread(
-                    target=self.translation_worker,
-                    daemon=True
-                )
-                worker_thread.start()
-                print("🔄 Started translation worker thread")
+                self.start_translation_worker()
+                print("🔄 Started translation worker")
             
             # Mark the time when TTS was enabled
             import time
@@ -1195,8 +1373,13 @@ class TranscriptionGUI(QMainWindow):
             if not self.text_translation_enabled:
                 self.translation_group.hide()
     
+    def on_text_translation_language_changed(self, language: str):
+        """Handle text translation language selector change."""
+        self._text_xlat_lang = language
+    
     def on_tts_language_changed(self, language: str):
         """Handle TTS language selector change."""
+        self._tts_lang = language
         if self.tts_to_mic_enabled:
             self.tts_controller.set_language(language)
             print(f"🌍 TTS language changed to: {language}")
@@ -1262,10 +1445,25 @@ class TranscriptionGUI(QMainWindow):
         else:
             self.api_status_label.setVisible(False)
     
-    def show_warning(self, message: str):
-        """Show warning icon with tooltip (thread-safe)."""
+    def queue_warning(self, message: str):
+        """
+        Record a warning for the next text flush, so a burst of errors
+        updates the warning indicator once.
+        """
+        self._pending_warning = message
+        self._pending_warning_count += 1
+        self._schedule_text_flush()
+    
+    def show_warning(self, message: str, count: int = 1):
+        """
+        Show warning icon with tooltip.
+        
+        Args:
+            message: Latest error message
+            count: Number of errors it stands for
+        """
         self.last_translation_error = message
-        self.translation_error_count += 1
+        self.translation_error_count += count
         
         # Show warning icon with count
         self.warning_label.setText(
@@ -1301,87 +1499,91 @@ class TranscriptionGUI(QMainWindow):
     
     def clear_warning(self):
         """Clear warning indicator."""
+        self._pending_warning = None
+        self._pending_warning_count = 0
         self.warning_label.setVisible(False)
         self.warning_label.setText("")
         self.warning_label.setToolTip("")
         self.last_translation_error = None
         self.translation_error_count = 0
     
+    def start_translation_worker(self):
+        """Allow translations to run and drain anything already queued."""
+        self.translation_worker_running = True
+        self._kick_translation_job()
+    
+    def _kick_translation_job(self):
+        """Submit a drain job unless one is running or nothing is queued."""
+        with self._translation_job_lock:
+            if (self._translation_job_active
+                    or not self.translation_worker_running
+                    or self.translation_queue.empty()):
+                return
+            self._translation_job_active = True
+        self.translation_pool.start(TranslationJob(self.translation_worker))
+    
     def translation_worker(self):
-        """Background worker thread for translation."""
-        while self.translation_worker_running:
-            try:
-                # Get item from queue (blocking with timeout)
-                item = self.translation_queue.get(timeout=1.0)
-                
-            except Empty:
-                # Queue timeout - this is normal, just continue
-                continue
-                
+        """Translate queued items until the queue is empty (pool thread)."""
+        while True:
+            # Checked under the lock so an item put right after this
+            # check is picked up by the producer's _kick_translation_job
+            with self._translation_job_lock:
+                if (not self.translation_worker_running
+                        or self.translation_queue.empty()):
+                    self._translation_job_active = False
+                    return
+            
+            # Finals queued meanwhile share the same LLM round-trip
+            batch = []
+            while len(batch) < TRANSLATION_BATCH_SIZE:
+                try:
+                    batch.append(self.translation_queue.get_nowait())
+                except Empty:
+                    break
+            if not batch:
+                continue  # Queue was cleared by a feature toggle
+            
             try:
-                text, source, speaker_id, timestamp = item
+                texts = [text for text, _, _, _ in batch]
                 
                 # Determine which language to use
                 # If both features enabled, use text translation language
                 if self.text_translation_enabled:
-                    target_lang = self.text_translation_language.currentText()
+                    target_lang = self._text_xlat_lang
                 elif self.tts_to_mic_enabled:
-                    target_lang = self.tts_language_selector.currentText()
+                    target_lang = self._tts_lang
                 else:
                     continue  # Neither feature enabled, skip
                 
                 try:
-                    # Get translation prompt
-                    prompt = prompts.get_translation_prompt(
-                        text, target_lang
-                    )
-                    
                     # Call LLM for translation (this can fail!)
-                    text_preview = text[:50] if len(text) > 50 else text
+                    text_preview = texts[0][:50]
+                    more = (f" (+{len(texts) - 1} more)"
+                            if len(texts) > 1 else "")
                     self.logger.log_system_event(
-                        f"LLM translate: '{text_preview}...' -> {target_lang}"
+                        f"LLM translate: '{text_preview}...'{more} "
+                        f"-> {target_lang}"
                     )
                     self.signals.set_api_status.emit(
                         f"Translating to {target_lang}..."
                     )
-                    translation = llm_service.chat(prompt)
-                    self.signals.set_api_status.emit("")
-                    trans_preview = (translation[:50] if len(translation) > 50
-                                     else translation)
-                    self.logger.log_system_event(
-                        f"LLM response: '{trans_preview}...'"
+                    translations = translate_texts(
+                        texts, target_lang, llm_service.chat
                     )
+                    self.signals.set_api_status.emit("")
                     
-                    # Emit signal to update GUI (for text translation)
-                    if self.text_translation_enabled:
-                        self.signals.append_translation.emit(
+                    for item, translation in zip(batch, translations):
+                        if not self.translation_worker_running:
+                            break  # Stopped (e.g. window closing)
+                        _, source, speaker_id, timestamp = item
+                        trans_preview = translation[:50]
+                        self.logger.log_system_event(
+                            f"LLM response: '{trans_preview}...'"
+                        )
+                        self._deliver_translation(
                             translation, source, speaker_id, timestamp
                         )
                     
-                    # Add to TTS buffer if TTS to mic is enabled
-                    if self.tts_to_mic_enabled and translation.strip():
-                        try:
-                            trans_preview = (translation[:40]
-                                             if len(translation) > 40
-                                             else translation)
-                            self.logger.log_system_event(
-                                f"TTS generation: '{trans_preview}...'"
-                            )
-                            self.signals.set_api_status.emit(
-                                "Generating TTS audio..."
-                            )
-                            self.tts_controller.add_translation(translation)
-                            self.signals.set_api_status.emit("")
-                            self.logger.log_system_event(
-                                "TTS audio added to buffer"
-                            )
-                        except Exception as tts_error:
-                            error_msg = (
-                                f"TTS generation failed:\n{str(tts_error)}"
-                            )
-                            print(f"❌ {error_msg}")
-                            self.signals.show_warning.emit(error_msg)
-                    
                 except ConnectionError as conn_err:
                     error_msg = (
                         f"Connection Error:\n"
@@ -1405,7 +1607,7 @@ class TranscriptionGUI(QMainWindow):
                     error_msg = (
                         f"Translation Failed:\n"
                         f"{str(translation_error)}\n\n"
-                        f"Text: {text[:50]}..."
+                        f"Text: {texts[0][:50]}..."
                     )
                     print(f"❌ {error_msg}")
                     self.signals.show_warning.emit(error_msg)
@@ -1418,6 +1620,38 @@ class TranscriptionGUI(QMainWindow):
                 print(f"❌ {error_msg}")
                 self.signals.show_warning.emit(error_msg)
     
+    def _deliver_translation(
+        self, translation: str, source: str, speaker_id: str, timestamp: str
+    ):
+        """Show a translation and/or hand it to TTS (worker thread)."""
+        # Emit signal to update GUI (for text translation)
+        if self.text_translation_enabled:
+            self.signals.append_translation.emit(
+                translation, source, speaker_id, timestamp
+            )
+        
+        # Add to TTS buffer if TTS to mic is enabled
+        if self.tts_to_mic_enabled and translation.strip():
+            try:
+                trans_preview = translation[:40]
+                self.logger.log_system_event(
+                    f"TTS generation: '{trans_preview}...'"
+                )
+                self.signals.set_api_status.emit(
+                    "Generating TTS audio..."
+                )
+                self.tts_controller.add_translation(translation)
+                self.signals.set_api_status.emit("")
+                self.logger.log_system_event(
+                    "TTS audio added to buffer"
+                )
+            except Exception as tts_error:
+                error_msg = (
+                    f"TTS generation failed:\n{str(tts_error)}"
+                )
+                print(f"❌ {error_msg}")
+                self.signals.show_warning.emit(error_msg)
+    
     def append_translation(
         self, text: str, source: str, speaker_id: str, timestamp: str
     ):
@@ -1430,22 +1664,15 @@ class TranscriptionGUI(QMainWindow):
         
         # Format speaker ID with "(translated)" label
         if speaker_id:
-            speaker_str = f"[{speaker_id} (translated)]"
+            speaker_str = f"[{escape_html(speaker_id)} (translated)]"
         else:
             speaker_str = "[(translated)]"
         
-        # Insert formatted text with HTML styling
-        self.translation_text.moveCursor(QTextCursor.MoveOperation.End)
-        self.translation_text.insertHtml(
-            f'<span style="color: #0066CC;">'
-            f'[{timestamp}] [{source_icon} {source}]{speaker_str} '
-            f'</span>'
-            f'<span style="color: #9932CC;">{text}</span><br>'
-        )
-        
-        # Auto-scroll to bottom
-        scrollbar = self.translation_text.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        # Queue formatted text with HTML styling for the next text flush
+        self._xlat_buf.append(_XLAT_TPL % (
+            timestamp, source_icon, source, speaker_str, escape_html(text)
+        ))
+        self._schedule_text_flush()
     
     def update_status(self, running: bool):
         """Update status indicator (fox animation) and buttons."""
@@ -1462,12 +1689,7 @@ class TranscriptionGUI(QMainWindow):
             # Start translation worker if any feature is enabled
             if (self.text_translation_enabled or self.tts_to_mic_enabled):
                 if not self.translation_worker_running:
-                    self.translation_worker_running = True
-                    worker_thread = threading.Thread(
-                        target=self.translation_worker,
-                        daemon=True
-                    )
-                    worker_thread.start()
+                    self.start_translation_worker()
             
             # Create session folder for logs
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -1494,7 +1716,7 @@ class TranscriptionGUI(QMainWindow):
             self.session_start_time = time.time()
             self.last_speech_time = time.time()
             self.timer.start(1000)  # Update every second
-            if SessionSettings.ENABLE_AUTO_PAUSE:
+            if get_settings().session.enable_auto_pause:
                 self.auto_pause_timer.start(5000)  # Check every 5 seconds
             
             # Show and enable chat UI
@@ -1555,21 +1777,25 @@ class TranscriptionGUI(QMainWindow):
         """Update session duration timer."""
         if self.session_start_time:
             elapsed = int(time.time() - self.session_start_time)
-            hours = elapsed // 3600
-            minutes = (elapsed % 3600) // 60
-            seconds = elapsed % 60
-            self.timer_label.setText(
-                f"⏱️ {hours:02d}:{minutes:02d}:{seconds:02d}"
+            # Hours are not wrapped at 24, so format only mm:ss
+            hours, rest = divmod(elapsed, 3600)
+            timer_str = (
+                f"⏱️ {hours:02d}:" + time.strftime("%M:%S", time.gmtime(rest))
             )
+            # Skip the relabel/repaint when the tick lands in the same second
+            if timer_str != self._last_timer_str:
+                self.timer_label.setText(timer_str)
+                self._last_timer_str = timer_str
     
     def check_auto_pause(self):
         """Check if auto-pause should be triggered."""
-        if not SessionSettings.ENABLE_AUTO_PAUSE:
+        session = get_settings().session
+        if not session.enable_auto_pause:
             return
         
         if self.last_speech_time:
             silence_duration = time.time() - self.last_speech_time
-            auto_pause_duration = SessionSettings.AUTO_PAUSE_SILENCE_DURATION
+            auto_pause_duration = session.auto_pause_silence_duration
             if silence_duration >= auto_pause_duration:
                 # Auto-pause triggered
                 print(
@@ -1592,8 +1818,17 @@ class TranscriptionGUI(QMainWindow):
         # Clear STT status when final result received
         self.signals.set_api_status.emit("")
         if text and text.strip():
-            timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             current_time = time.time()
+            # Results within the same second share one formatted stamp;
+            # (second, text) is swapped as one tuple since MIC and SYSTEM
+            # callbacks run on different threads
+            sec = int(current_time)
+            cached_sec, timestamp = self._timestamp_cache
+            if sec != cached_sec:
+                timestamp = time.strftime(
+                    "%Y-%m-%d %H:%M:%S", time.localtime(sec)
+                )
+                self._timestamp_cache = (sec, timestamp)
             
             # Update logger session directory if not already done
             if not self.session_started and self.meeting_assistant.session_active:
@@ -1602,56 +1837,45 @@ class TranscriptionGUI(QMainWindow):
                 self.session_started = True
             
             # FIRST: Bidirectional duplicate detection
-            # Normalize text for comparison
-            text_normalized = text.lower().strip().replace(
-                " ", ""
-            ).replace(".", "").replace(",", "")
+            # Normalize once; recent texts are indexed by normalized form
+            text_normalized = normalize_for_dedup(text)
             
             is_duplicate = False
+            window = self.duplicate_window_seconds
             
             # Check MIC against recent SYSTEM (SYSTEM came first)
             if "MIC" in source and self.mixer_started:
-                for sys_text, sys_time in self.recent_sys_transcriptions:
-                    time_diff = current_time - sys_time
-                    if time_diff < self.duplicate_window_seconds:
-                        sys_normalized = sys_text.lower().strip().replace(
-                            " ", ""
-                        ).replace(".", "").replace(",", "")
-                        if text_normalized == sys_normalized:
-                            is_duplicate = True
-                            print(f"� Filtered MIC duplicate of SYSTEM: {text[:50]}...")
-                            break
+                sys_time = self._recent_sys_norm.get(text_normalized)
+                if sys_time is not None and current_time - sys_time < window:
+                    is_duplicate = True
+                    print(f"� Filtered MIC duplicate of SYSTEM: {text[:50]}...")
             
             # Check SYSTEM against recent MIC (MIC came first)
             if "SYSTEM" in source and self.mixer_started:
-                for mic_text, mic_time in self.recent_mic_transcriptions:
-                    time_diff = current_time - mic_time
-                    if time_diff < self.duplicate_window_seconds:
-                        mic_normalized = mic_text.lower().strip().replace(
-                            " ", ""
-                        ).replace(".", "").replace(",", "")
-                        if text_normalized == mic_normalized:
-                            is_duplicate = True
-                            print(f"🔇 Filtered SYSTEM duplicate of MIC: {text[:50]}...")
-                            break
+                mic_time = self._recent_mic_norm.get(text_normalized)
+                if mic_time is not None and current_time - mic_time < window:
+                    is_duplicate = True
+                    print(f"🔇 Filtered SYSTEM duplicate of MIC: {text[:50]}...")
             
             if is_duplicate:
                 return
             
             # Track this transcription for future duplicate detection
             if "MIC" in source:
-                self.recent_mic_transcriptions.append((text, current_time))
-                self.recent_mic_transcriptions = [
-                    (t, ts) for t, ts in self.recent_mic_transcriptions
-                    if current_time - ts < 10.0
-                ]
+                recent = self.recent_mic_transcriptions
+                recent.append((text, current_time))
+                while current_time - recent[0][1] >= 10.0:
+                    recent.popleft()
+                self._recent_mic_norm[text_normalized] = current_time
+                prune_recent(self._recent_mic_norm, current_time)
                 print(f"📝 Tracked MIC: {text[:30]}... (total: {len(self.recent_mic_transcriptions)})")
             elif "SYSTEM" in source:
-                self.recent_sys_transcriptions.append((text, current_time))
-                self.recent_sys_transcriptions = [
-                    (t, ts) for t, ts in self.recent_sys_transcriptions
-                    if current_time - ts < 10.0
-                ]
+                recent = self.recent_sys_transcriptions
+                recent.append((text, current_time))
+                while current_time - recent[0][1] >= 10.0:
+                    recent.popleft()
+                self._recent_sys_norm[text_normalized] = current_time
+                prune_recent(self._recent_sys_norm, current_time)
                 print(f"� Tracked SYSTEM: {text[:30]}... (total: {len(self.recent_sys_transcriptions)})")
             
             # THIRD: Check if SYSTEM is actually a TTS translation
@@ -1660,10 +1884,10 @@ class TranscriptionGUI(QMainWindow):
             if "SYSTEM" in source:
                 # Check if this text was from original speech (MIC/SYSTEM)
                 was_original_speech = False
-                for queued_text, queued_time in self.queued_for_translation:
+                queued = tuple(self.queued_for_translation)  # Snapshot
+                for queued_text, queued_time in queued:
                     # Check if this matches queued original text
-                    if (text.lower().strip().replace(" ", "") ==
-                            queued_text.lower().strip().replace(" ", "")):
+                    if text_normalized == queued_text:
                         was_original_speech = True
                         break
                 
@@ -1689,26 +1913,30 @@ class TranscriptionGUI(QMainWindow):
                 should_queue = True
                 if self.tts_to_mic_enabled:
                     # When TTS enabled: check if text was seen before TTS
-                    text_hash = text.lower().strip().replace(" ", "")
-                    if text_hash in self.seen_before_tts:
+                    if text_normalized in self.seen_before_tts:
                         should_queue = False
                         print("⏭️ Skipping old speech from before TTS enable")
                 
-                if should_queue and self.translation_queue.qsize() < 5:
+                # At most one batch waits; later finals are dropped
+                queue_full = (
+                    self.translation_queue.qsize() >= TRANSLATION_BATCH_SIZE
+                )
+                if should_queue and not queue_full:
                     print(f"📤 Queued for translation: {text[:40]}...")
                     self.translation_queue.put(
                         (text, source, speaker_id, timestamp)
                     )
+                    self._kick_translation_job()
                     # Track that this text was queued for translation
-                    self.queued_for_translation.append((text, current_time))
-                    # Keep only recent entries
-                    self.queued_for_translation = [
-                        (t, ts) for t, ts in self.queued_for_translation
-                        if current_time - ts < self.translation_window_seconds
-                    ]
+                    queued = self.queued_for_translation
+                    queued.append((text_normalized, current_time))
+                    # Keep only recent entries (oldest are at the left)
+                    window = self.translation_window_seconds
+                    while current_time - queued[0][1] >= window:
+                        queued.popleft()
                 elif not should_queue:
                     print(f"⏸️ NOT queued (should_queue=False): {text[:40]}...")
-                elif self.translation_queue.qsize() >= 5:
+                else:
                     print(f"⏸️ NOT queued (queue full): {text[:40]}...")
             
             # Also log to file (translations are NOT logged)
@@ -1760,11 +1988,14 @@ class TranscriptionGUI(QMainWindow):
             try:
                 # Initialize PyAudio
                 self.audio = pyaudio.PyAudio()
+                capture_frames = self.chunk_size * CAPTURE_BUFFER_CHUNKS
                 
                 # Detect audio devices
+                # Indices must come from the instance the streams use
                 recorder = AudioRecorder(
                     sample_rate=self.sample_rate,
-                    chunk_size=self.chunk_size
+                    chunk_size=self.chunk_size,
+                    audio=self.audio
                 )
                 devices = recorder.list_audio_devices()
                 
@@ -1828,7 +2059,7 @@ class TranscriptionGUI(QMainWindow):
                         rate=self.sample_rate,
                         input=True,
                         input_device_index=mic_device,
-                        frames_per_buffer=self.chunk_size,
+                        frames_per_buffer=capture_frames,
                         stream_callback=self.audio_callback_mic
                     )
                     self.mic_audio_stream.start_stream()
@@ -1858,7 +2089,7 @@ class TranscriptionGUI(QMainWindow):
                         rate=self.sample_rate,
                         input=True,
                         input_device_index=sys_device,
-                        frames_per_buffer=self.chunk_size,
+                        frames_per_buffer=capture_frames,
                         stream_callback=self.audio_callback_sys
                     )
                     self.sys_audio_stream.start_stream()
@@ -2209,6 +2440,17 @@ class TranscriptionGUI(QMainWindow):
         # Stop chat worker
         self.chat_worker_running = False
         
+        # Stop translations: drop queued items and pool jobs; a running
+        # job exits after its current LLM call instead of blocking here
+        self.translation_worker_running = False
+        while not self.translation_queue.empty():
+            try:
+                self.translation_queue.get_nowait()
+            except Empty:
+                break
+        self.translation_pool.clear()
+        self.translation_pool.waitForDone(TRANSLATION_SHUTDOWN_WAIT_MS)
+        
         # Cleanup TTS controller
         self.tts_controller.cleanup()
         
@@ -2223,6 +2465,9 @@ class TranscriptionGUI(QMainWindow):
 
 def main():
     """Main entry point."""
+    install_queue_logging()
+    # Load the Speech SDK while Qt and the window are being set up
+    preload_sdk()
     app = QApplication(sys.argv)
     window = TranscriptionGUI()
     window.show()
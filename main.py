@@ -15,9 +15,11 @@ import signal
 import sys
 import pyaudio
 import time
-from services.speech_engine.azure_speech_service import AzureSpeechTranscriber
+from services.speech_engine.azure_speech_service import (
+    AzureSpeechTranscriber, install_queue_logging, preload_sdk
+)
 from services.speech_engine.stt.transcription_logger import TranscriptionLogger
-from config import AudioSettings, LogSettings
+from config import CHUNK_SIZE, SAMPLE_RATE, get_settings
 from services.audio.audio_recorder import AudioRecorder
 from services.llm.meeting_assistant_service import MeetingAssistantService
 
@@ -28,7 +30,7 @@ class StreamingTranscriptionApp:
         print("🚀 Initializing AI-Powered Meeting Assistant...")
         
         # Initialize components
-        self.logger = TranscriptionLogger(log_file=LogSettings.LOG_FILE)
+        self.logger = TranscriptionLogger(log_file=get_settings().log.log_file)
         self.meeting_assistant = MeetingAssistantService()
         
         # Update logger with session directory once meeting starts
@@ -37,8 +39,8 @@ class StreamingTranscriptionApp:
         
         # Initialize audio
         self.audio = pyaudio.PyAudio()
-        self.sample_rate = AudioSettings.SAMPLE_RATE
-        self.chunk_size = AudioSettings.CHUNK_SIZE
+        self.sample_rate = SAMPLE_RATE
+        self.chunk_size = CHUNK_SIZE
         
         # Azure Speech Service instances for each source
         self.mic_transcriber = None
@@ -145,9 +147,11 @@ class StreamingTranscriptionApp:
     def run(self):
         """Run streaming transcription."""
         # Detect audio devices
+        # Indices must come from the instance the streams use
         recorder = AudioRecorder(
             sample_rate=self.sample_rate,
-            chunk_size=self.chunk_size
+            chunk_size=self.chunk_size,
+            audio=self.audio
         )
         devices = recorder.list_audio_devices()
         
@@ -196,7 +200,7 @@ class StreamingTranscriptionApp:
                     result_callback=self.result_callback,
                     interim_callback=(
                         self.interim_callback
-                        if LogSettings.SHOW_INTERIM_RESULTS else None
+                        if get_settings().log.show_interim_results else None
                     )
                 )
             )
@@ -211,7 +215,7 @@ class StreamingTranscriptionApp:
                     result_callback=self.result_callback,
                     interim_callback=(
                         self.interim_callback
-                        if LogSettings.SHOW_INTERIM_RESULTS else None
+                        if get_settings().log.show_interim_results else None
                     )
                 )
             )
@@ -308,6 +312,8 @@ class StreamingTranscriptionApp:
 
 def main():
     """Main entry point."""
+    install_queue_logging()
+    preload_sdk()
     app = StreamingTranscriptionApp()
     app.run()
 
@@ -4,5 +4,7 @@ Audio Services Package
 Audio-related functionality for the Meeting Assistant:
 - AudioRecorder: System and microphone audio recording
 - AudioMixer: Real-time audio mixing for TTS integration
+- audio_backend: Shared PyAudio instance for mixer and recorder
+- AudioRingBuffer: Lock-free PCM FIFO between TTS and mixer threads
 - VADDetector: Voice Activity Detection
 """
\ No newline at end of file
@@ -0,0 +1,80 @@
+"""
+Audio Backend: process-wide PortAudio host shared by audio classes.
+
+Each pyaudio.PyAudio() initializes PortAudio and scans every host API,
+which is slow (notably on macOS CoreAudio) and duplicates device state.
+AudioMixer and AudioRecorder share one instance from get_pyaudio();
+it is terminated once at interpreter exit.
+
+PortAudio only enumerates devices when it is initialized, so each
+PyAudio instance's device table is built once. Streams must be opened
+on the instance whose table their device index came from: an instance
+created after a device was plugged in or removed gets a new table.
+"""
+
+import atexit
+import threading
+import weakref
+from typing import Dict, List, Optional, Tuple
+
+import pyaudio
+
+
+_pyaudio: Optional[pyaudio.PyAudio] = None
+# Device table per PyAudio instance, dropped with the instance
+_device_tables: "weakref.WeakKeyDictionary[pyaudio.PyAudio, list]" = (
+    weakref.WeakKeyDictionary()
+)
+_lock = threading.Lock()
+
+
+def get_pyaudio() -> pyaudio.PyAudio:
+    """
+    Get the shared PyAudio instance, creating it on first use.
+
+    Callers must not call terminate() on it.
+    """
+    global _pyaudio
+    if _pyaudio is None:
+        with _lock:
+            if _pyaudio is None:
+                _pyaudio = pyaudio.PyAudio()
+                atexit.register(_terminate)
+    return _pyaudio
+
+
+def get_device_table(
+    audio: Optional[pyaudio.PyAudio] = None
+) -> List[Tuple[int, Dict, str]]:
+    """
+    Query every PortAudio device of a PyAudio instance once.
+
+    Args:
+        audio: Instance whose devices are listed (None for the shared one)
+
+    Returns:
+        List of (index, device_info, lower-cased name) tuples
+    """
+    if audio is None:
+        audio = get_pyaudio()
+    devices = _device_tables.get(audio)
+    if devices is None:
+        devices = []
+        for i in range(audio.get_device_count()):
+            try:
+                info = audio.get_device_info_by_index(i)
+            except Exception:
+                continue
+            devices.append((i, info, info['name'].lower()))
+        _device_tables[audio] = devices
+    return devices
+
+
+def _terminate():
+    """Release PortAudio at interpreter exit."""
+    global _pyaudio
+    with _lock:
+        if _pyaudio is not None:
+            _device_tables.pop(_pyaudio, None)
+            _pyaudio.terminate()
+            _pyaudio = None
@@ -15,14 +15,44 @@ Platform Support:
 """
 
 import pyaudio
+import os
+import sys
+import ctypes
 import threading
-import time
 import logging
 from typing import Optional
 import numpy as np
 
+from services.audio import audio_kernels
+from services.audio.audio_backend import get_device_table, get_pyaudio
+from services.audio.audio_ring_buffer import AudioRingBuffer
+
 logger = logging.getLogger(__name__)
 
+# macOS QoS class for latency-critical work (pthread/qos.h)
+_QOS_CLASS_USER_INTERACTIVE = 0x21
+
+
+def _raise_thread_priority():
+    """
+    Best-effort realtime priority for the calling audio thread.
+    Linux: SCHED_FIFO (needs CAP_SYS_NICE / rtprio limit).
+    macOS: USER_INTERACTIVE QoS class.
+    """
+    try:
+        if hasattr(os, 'sched_setscheduler'):
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(10))
+        elif sys.platform == 'darwin':
+            libc = ctypes.CDLL('/usr/lib/libSystem.dylib')
+            libc.pthread_set_qos_class_self_np(
+                _QOS_CLASS_USER_INTERACTIVE, 0
+            )
+        else:
+            return
+        logger.info("⚡ Mixer audio thread running at realtime priority")
+    except (OSError, AttributeError) as e:
+        logger.debug(f"Realtime priority not available: {e}")
+
 
 class AudioMixer:
     """
@@ -30,15 +60,31 @@ class AudioMixer:
     with mixing capability.
     """
     
-    def __init__(self):
-        self.audio = pyaudio.PyAudio()
+    # Device name keywords (matched against lower-cased names)
+    SKIP_DEVICE_KEYWORDS = ('blackhole', 'vb-cable', 'aggregate',
+                            'multi-output')
+    # Priority list for microphones
+    PRIORITY_MIC_KEYWORDS = ('jabra', 'evolve', 'built-in',
+                             'macbook pro microphone')
+    # BlackHole (macOS) or VB-CABLE (Windows)
+    VIRTUAL_DEVICE_KEYWORDS = ('blackhole', 'vb-cable', 'vb cable')
+    
+    def __init__(self, chunk_size: int = 256):
+        """
+        Initialize audio mixer.
+        
+        Args:
+            chunk_size: Frames per buffer. Smaller = lower latency;
+                       256 @ 48 kHz ≈ 5.3 ms, 1024 ≈ 21 ms
+        """
+        self.audio = get_pyaudio()  # Shared; never terminated here
         self.is_running = False
         self.mixer_thread: Optional[threading.Thread] = None
         
         # Audio configuration
         self.sample_rate = 48000  # 48kHz to match system
         self.channels = 2  # Stereo
-        self.chunk_size = 1024  # Frames per buffer
+        self.chunk_size = chunk_size  # Frames per buffer
         self.format = pyaudio.paInt16
         
         # Device indices
@@ -46,54 +92,83 @@ class AudioMixer:
         self.virtual_device_index: Optional[int] = None
         
         # TTS mixing
-        self.tts_buffer = bytearray()
+        # Lock-free SPSC ring: TTS thread writes, mixer thread reads.
+        # Sized in seconds because TTS utterances are queued whole.
+        self.tts_buffer_seconds = 30.0
+        self.tts_ring = AudioRingBuffer(
+            int(self.sample_rate * self.tts_buffer_seconds) * self.channels
+        )
+        # Serializes TTS producers only; never taken by the mixer thread
         self.tts_lock = threading.Lock()
         self.is_tts_playing = False
         
-    def _find_microphone_device(self) -> Optional[int]:
+        # Pre-allocated scratch reused every chunk (no per-chunk
+        # allocation on the realtime threads)
+        chunk_samples = self.chunk_size * self.channels
+        # Mixed stereo output of the mic callback
+        self._stereo_scratch = np.empty(chunk_samples, dtype=np.int16)
+        # TTS samples consumed per chunk (interleaved stereo)
+        self._tts_scratch = np.empty_like(self._stereo_scratch)
+        
+        # Mixed output handed from the mic callback (producer) to the
+        # virtual device output callback (consumer); 4 chunks of slack
+        # absorb scheduling jitter between the two PortAudio threads
+        self._out_ring = AudioRingBuffer(chunk_samples * 4)
+        self.output_underruns = 0
+        self.output_overruns = 0  # Mixed chunks dropped on a full ring
+        # Output callback buffer; the numpy scratch is a view over it
+        self._out_buf = bytearray(chunk_samples * 2)
+        # PyAudio's callbacks only accept read-only buffers
+        self._out_view = memoryview(self._out_buf).toreadonly()
+        self._out_scratch = np.frombuffer(self._out_buf, dtype=np.int16)
+        
+        self._stop_event = threading.Event()
+        
+    def _get_device_table(self) -> list:
+        """
+        Get the PortAudio device table shared with other audio classes.
+        
+        Returns:
+            List of (index, device_info, lower-cased name) tuples
+        """
+        return get_device_table()
+    
+    def _find_microphone_device(
+        self, devices: Optional[list] = None
+    ) -> Optional[int]:
         """
         Find the physical microphone device (not virtual devices).
         Priority: Jabra > MacBook Pro Microphone > Default input
-        """
-        device_count = self.audio.get_device_count()
         
-        # Priority list for microphones
-        priority_mics = [
-            'jabra', 'evolve', 'built-in', 'macbook pro microphone'
-        ]
+        Args:
+            devices: Result of _get_device_table() (looked up if None)
+        """
+        if devices is None:
+            devices = self._get_device_table()
         
         candidates = []
         default_input = self.audio.get_default_input_device_info()
         
-        for i in range(device_count):
-            try:
-                info = self.audio.get_device_info_by_index(i)
-                name = info['name'].lower()
-                
-                # Skip virtual devices
-                skip_devices = ['blackhole', 'vb-cable', 'aggregate',
-                                'multi-output']
-                if any(skip in name for skip in skip_devices):
-                    continue
-                
-                # Must have input channels
-                if info['maxInputChannels'] > 0:
-                    # Check priority
-                    priority = 999
-                    for idx, keyword in enumerate(priority_mics):
-                        if keyword in name:
-                            priority = idx
-                            break
-                    
-                    candidates.append({
-                        'index': i,
-                        'name': info['name'],
-                        'priority': priority,
-                        'is_default': (i == default_input['index'])
-                    })
-                    
-            except Exception:
+        for i, info, name in devices:
+            # Skip virtual devices
+            if any(skip in name for skip in self.SKIP_DEVICE_KEYWORDS):
                 continue
+            
+            # Must have input channels
+            if info['maxInputChannels'] > 0:
+                # Check priority
+                priority = 999
+                for idx, keyword in enumerate(self.PRIORITY_MIC_KEYWORDS):
+                    if keyword in name:
+                        priority = idx
+                        break
+                
+                candidates.append({
+                    'index': i,
+                    'name': info['name'],
+                    'priority': priority,
+                    'is_default': (i == default_input['index'])
+                })
         
         if not candidates:
             logger.error("❌ No microphone device found!")
@@ -111,30 +186,27 @@ class AudioMixer:
         )
         return selected['index']
     
-    def _find_virtual_device(self) -> Optional[int]:
+    def _find_virtual_device(
+        self, devices: Optional[list] = None
+    ) -> Optional[int]:
         """
         Find the virtual audio device (BlackHole/VB-CABLE).
+        
+        Args:
+            devices: Result of _get_device_table() (looked up if None)
         """
-        device_count = self.audio.get_device_count()
+        if devices is None:
+            devices = self._get_device_table()
         
-        for i in range(device_count):
-            try:
-                info = self.audio.get_device_info_by_index(i)
-                name = info['name'].lower()
-                
-                # Look for BlackHole (macOS) or VB-CABLE (Windows)
-                virtual_keywords = ['blackhole', 'vb-cable', 'vb cable']
-                if any(keyword in name for keyword in virtual_keywords):
-                    # Must have output channels
-                    if info['maxOutputChannels'] >= 2:
-                        logger.info(
-                            f"✅ Virtual audio device found: {info['name']} "
-                            f"(index: {i})"
-                        )
-                        return i
-                        
-            except Exception:
-                continue
+        for i, info, name in devices:
+            if any(kw in name for kw in self.VIRTUAL_DEVICE_KEYWORDS):
+                # Must have output channels
+                if info['maxOutputChannels'] >= 2:
+                    logger.info(
+                        f"✅ Virtual audio device found: {info['name']} "
+                        f"(index: {i})"
+                    )
+                    return i
         
         logger.error(
             "❌ Virtual audio device not found! "
@@ -142,6 +214,13 @@ class AudioMixer:
         )
         return None
     
+    def _select_devices(self):
+        """Pick mic and virtual devices from one device table lookup."""
+        # Single device table shared by both finders
+        devices = self._get_device_table()
+        self.mic_device_index = self._find_microphone_device(devices)
+        self.virtual_device_index = self._find_virtual_device(devices)
+    
     def start(self) -> bool:
         """
         Start the audio mixer thread.
@@ -152,15 +231,18 @@ class AudioMixer:
             return True
         
         # Find devices
-        self.mic_device_index = self._find_microphone_device()
-        self.virtual_device_index = self._find_virtual_device()
+        self._select_devices()
         
         if self.mic_device_index is None or self.virtual_device_index is None:
             logger.error("❌ Cannot start mixer: required devices not found")
             return False
         
+        # Compile mixing kernels before the realtime loop needs them
+        audio_kernels.warmup()
+        
         # Start mixer thread
         self.is_running = True
+        self._stop_event.clear()
         self.mixer_thread = threading.Thread(
             target=self._mixer_loop, daemon=True
         )
@@ -177,6 +259,7 @@ class AudioMixer:
             return
         
         self.is_running = False
+        self._stop_event.set()
         
         if self.mixer_thread:
             self.mixer_thread.join(timeout=2.0)
@@ -185,7 +268,8 @@ class AudioMixer:
     
     def _mixer_loop(self):
         """
-        Main mixer loop: read from mic, mix with TTS, write to virtual.
+        Mixer lifetime: open streams, let the mic callback read from mic,
+        mix with TTS and write to virtual, until stop() is requested.
         """
         mic_stream = None
         virtual_stream = None
@@ -200,156 +284,45 @@ class AudioMixer:
             return
         
         try:
-            # Open microphone input stream
-            mic_stream = self.audio.open(
-                format=self.format,
-                channels=1,  # Microphone is mono
-                rate=self.sample_rate,
-                input=True,
-                input_device_index=self.mic_device_index,
-                frames_per_buffer=self.chunk_size
-            )
+            self.output_underruns = 0
+            self.output_overruns = 0
             
-            # Open virtual device output stream
+            # Open virtual device output stream in callback mode: it
+            # pulls mixed audio from the output ring, so mixing never
+            # blocks on the device driver
             virtual_stream = self.audio.open(
                 format=self.format,
                 channels=self.channels,  # Virtual device is stereo
                 rate=self.sample_rate,
                 output=True,
                 output_device_index=self.virtual_device_index,
-                frames_per_buffer=self.chunk_size
+                frames_per_buffer=self.chunk_size,
+                stream_callback=self._make_virtual_callback()
             )
             
-            logger.info("🔄 Mixer loop started: mic → virtual device")
+            # Open microphone input stream in callback mode on the same
+            # shared PyAudio instance, so device indices come from the
+            # table the mic was selected from
+            mic_stream = self.audio.open(
+                format=self.format,
+                channels=1,  # Microphone is mono
+                rate=self.sample_rate,
+                input=True,
+                input_device_index=self.mic_device_index,
+                frames_per_buffer=self.chunk_size,
+                stream_callback=self._make_mic_callback()
+            )
             
-            bytes_per_sample = 2  # paInt16 = 2 bytes
-            chunk_bytes = self.chunk_size * bytes_per_sample
+            logger.info("🔄 Mixer loop started: mic → virtual device")
             
-            while self.is_running:
-                try:
-                    # Read from microphone (mono)
-                    mic_data = mic_stream.read(
-                        self.chunk_size, exception_on_overflow=False
-                    )
-                    
-                    # Convert to numpy array for mixing
-                    mic_array = np.frombuffer(mic_data, dtype=np.int16)
-                    
-                    # Duplicate mono to stereo (L and R same)
-                    stereo_array = np.column_stack(
-                        (mic_array, mic_array)
-                    ).flatten()
-                    
-                    # Check if TTS is playing
-                    with self.tts_lock:
-                        tts_buffer_size = chunk_bytes * self.channels
-                        if (self.is_tts_playing and
-                                len(self.tts_buffer) >= tts_buffer_size):
-                            # Extract TTS chunk
-                            tts_chunk = bytes(
-                                self.tts_buffer[:tts_buffer_size]
-                            )
-                            self.tts_buffer = self.tts_buffer[
-                                tts_buffer_size:
-                            ]
-                            
-                            # Convert TTS to numpy array
-                            tts_array = np.frombuffer(
-                                tts_chunk, dtype=np.int16
-                            )
-                            
-                            # Check if microphone has significant audio
-                            # Calculate RMS (root mean square) of mic audio
-                            mic_float = stereo_array.astype(np.float32)
-                            mic_rms = np.sqrt(np.mean(mic_float ** 2))
-                            
-                            # Threshold for "silence" (adjust if needed)
-                            # Typical background noise is < 500 RMS
-                            silence_threshold = 500
-                            
-                            if mic_rms < silence_threshold:
-                                # Mic is silent - use TTS at full volume
-                                # No mixing needed, just pass TTS through
-                                print(
-                                    f"🔊 TTS only (mic silent: "
-                                    f"RMS={mic_rms:.1f})"
-                                )
-                                output_data = tts_array.tobytes()
-                            else:
-                                # Mic has audio - mix with TTS
-                                # Use weighted average: 60% TTS, 40% mic
-                                # This ensures TTS is prominent
-                                print(
-                                    f"🎵 Mixing TTS+Mic (mic active: "
-                                    f"RMS={mic_rms:.1f})"
-                                )
-                                mixed_array = (
-                                    (tts_array.astype(np.int32) * 6 +
-                                     stereo_array.astype(np.int32) * 4)
-                                ) // 10
-                                mixed_array = np.clip(
-                                    mixed_array, -32768, 32767
-                                ).astype(np.int16)
-                                
-                                output_data = mixed_array.tobytes()
-                        
-                        elif self.is_tts_playing and len(self.tts_buffer) > 0:
-                            # TTS buffer running out, pad with zeros
-                            remaining = len(self.tts_buffer)
-                            tts_chunk = bytes(self.tts_buffer)
-                            self.tts_buffer.clear()
-                            
-                            # Pad TTS chunk
-                            pad_size = chunk_bytes * self.channels - remaining
-                            tts_padded = tts_chunk + b'\x00' * pad_size
-                            tts_array = np.frombuffer(
-                                tts_padded, dtype=np.int16
-                            )
-                            
-                            # Check mic level
-                            mic_float = stereo_array.astype(np.float32)
-                            mic_rms = np.sqrt(np.mean(mic_float ** 2))
-                            silence_threshold = 500
-                            
-                            if mic_rms < silence_threshold:
-                                # Mic silent - use TTS at full volume
-                                output_data = tts_array.tobytes()
-                            else:
-                                # Mix with mic audio (60% TTS, 40% mic)
-                                mixed_array = (
-                                    (tts_array.astype(np.int32) * 6 +
-                                     stereo_array.astype(np.int32) * 4)
-                                ) // 10
-                                mixed_array = np.clip(
-                                    mixed_array, -32768, 32767
-                                ).astype(np.int16)
-                                
-                                output_data = mixed_array.tobytes()
-                        
-                        elif self.is_tts_playing and len(self.tts_buffer) == 0:
-                            # TTS finished
-                            self.is_tts_playing = False
-                            logger.info("✅ TTS mixing complete")
-                            output_data = stereo_array.tobytes()
-                        
-                        else:
-                            # No TTS, just pass through mic audio
-                            output_data = stereo_array.tobytes()
-                    
-                    # Write to virtual device
-                    virtual_stream.write(output_data)
-                    
-                except Exception as e:
-                    # Only log if we're supposed to be running
-                    if self.is_running:
-                        logger.error(f"❌ Error in mixer loop: {e}")
-                    time.sleep(0.01)
+            # Nothing to poll: just wait until stop() is requested
+            self._stop_event.wait()
             
         except Exception as e:
             logger.error(f"❌ Fatal error in mixer loop: {e}")
         
         finally:
-            # Clean up streams
+            # Clean up streams (mic first so the callback stops writing)
             if mic_stream:
                 try:
                     mic_stream.stop_stream()
@@ -364,8 +337,162 @@ class AudioMixer:
                 except Exception:
                     pass
             
+            if self.output_underruns:
+                logger.warning(
+                    f"⚠️ Virtual device output underruns: "
+                    f"{self.output_underruns}"
+                )
+            if self.output_overruns:
+                logger.warning(
+                    f"⚠️ Virtual device output overruns: "
+                    f"{self.output_overruns}"
+                )
             logger.info("🔄 Mixer loop stopped")
     
+    def _make_mic_callback(self):
+        """
+        Build the PortAudio input callback that mixes one mic chunk
+        with TTS and pushes the result to the output ring.
+        
+        Everything the callback touches per chunk is bound to a local
+        name up front, so the hot path does no module/attribute lookups
+        except for the shared is_running / is_tts_playing flags.
+        """
+        frombuffer = np.frombuffer
+        int16 = np.int16
+        float32 = np.float32
+        sqrt = np.sqrt
+        mean = np.mean
+        copyto = np.copyto
+        mix_mono_tts_stereo = audio_kernels.mix_mono_tts_stereo
+        tts_read_into = self.tts_ring.read_into
+        stereo_array = self._stereo_scratch
+        tts_array = self._tts_scratch
+        out_write = self._out_ring.write
+        stereo_size = stereo_array.size
+        is_debug = logger.isEnabledFor
+        DEBUG = logging.DEBUG
+        pa_result = (None, pyaudio.paContinue)
+        
+        # Threshold for "silence" (adjust if needed)
+        # Typical background noise is < 500 RMS
+        silence_threshold = 500
+        
+        def mic_is_silent(mic_array):
+            # Calculate RMS (root mean square) of mic audio
+            mic_float = mic_array.astype(float32)
+            return sqrt(mean(mic_float ** 2)) < silence_threshold
+        
+        priority_raised = False
+        was_playing = False
+        tts_only_chunks = 0  # Chunks of the current TTS with mic silent
+        error_count = 0  # Consecutive failed chunks
+        overrun_count = 0  # Consecutive chunks dropped on a full ring
+        
+        def mic_callback(in_data, frame_count, time_info, status):
+            nonlocal priority_raised, was_playing, tts_only_chunks
+            nonlocal error_count, overrun_count
+            if not priority_raised:
+                # First chunk on PortAudio's audio thread
+                priority_raised = True
+                _raise_thread_priority()
+            
+            try:
+                # Zero-copy view of the callback's input bytes
+                mic_array = frombuffer(in_data, dtype=int16)
+                
+                # Take one chunk of TTS (no lock: SPSC ring). An empty
+                # ring yields all zeros, so one mix path covers both
+                # TTS and mic-only passthrough
+                tts_count = tts_read_into(tts_array)
+                
+                if tts_count and mic_is_silent(mic_array):
+                    # Mic is silent - use TTS at full volume
+                    # No mixing needed, just pass TTS through
+                    tts_only_chunks += 1
+                    copyto(stereo_array, tts_array)
+                else:
+                    # Fused mono→stereo + mix: halving-add while TTS
+                    # plays, unscaled mic passthrough (shift 0) otherwise
+                    mix_mono_tts_stereo(
+                        mic_array, tts_array, stereo_array,
+                        1 if tts_count else 0
+                    )
+                
+                # TTS state follows the ring fill level; log on edges
+                playing = tts_count > 0
+                if playing != was_playing:
+                    was_playing = playing
+                    if not playing and is_debug(DEBUG):
+                        # Summarized once per utterance, never per chunk
+                        logger.debug(
+                            f"✅ TTS mixing complete "
+                            f"({tts_only_chunks} chunks TTS only)"
+                        )
+                    tts_only_chunks = 0
+                self.is_tts_playing = playing
+                
+                # Hand off to the virtual device output callback; a
+                # full ring means the output side has stalled
+                if out_write(stereo_array) < stereo_size:
+                    self.output_overruns += 1
+                    overrun_count += 1
+                    if overrun_count == 1:
+                        logger.warning(
+                            "⚠️ Virtual device output ring full, "
+                            "dropping mixed audio"
+                        )
+                elif overrun_count:
+                    logger.info(
+                        f"🔄 Virtual device output resumed after "
+                        f"{overrun_count} dropped chunks"
+                    )
+                    overrun_count = 0
+                
+                if error_count:
+                    logger.info(
+                        f"🔄 Mixer recovered after {error_count} failed chunks"
+                    )
+                    error_count = 0
+                
+            except Exception as e:
+                # Drop just this chunk and carry on with the next one;
+                # warn once per burst of errors rather than per chunk
+                error_count += 1
+                if error_count == 1 and self.is_running:
+                    logger.warning(f"⚠️ Error in mixer loop: {e}")
+            
+            return pa_result
+        
+        return mic_callback
+    
+    def _make_virtual_callback(self):
+        """
+        Build the PortAudio output callback that feeds the virtual device
+        from the output ring. On underrun the missing tail is silence.
+        """
+        out_read_into = self._out_ring.read_into
+        out_scratch = self._out_scratch
+        out_view = self._out_view
+        channels = self.channels
+        pa_continue = pyaudio.paContinue
+        
+        priority_raised = False
+        
+        def virtual_callback(in_data, frame_count, time_info, status):
+            nonlocal priority_raised
+            if not priority_raised:
+                # First chunk on the output stream's audio thread
+                priority_raised = True
+                _raise_thread_priority()
+            
+            samples = frame_count * channels
+            if out_read_into(out_scratch[:samples]) < samples:
+                self.output_underruns += 1
+            return (out_view[:samples * 2], pa_continue)
+        
+        return virtual_callback
+    
     def queue_tts_audio(self, audio_data: bytes):
         """
         Queue TTS audio data to be mixed with microphone audio.
@@ -373,31 +500,37 @@ class AudioMixer:
         Args:
             audio_data: PCM audio data (16-bit, match sample rate/channels)
         """
+        samples = np.frombuffer(audio_data, dtype=np.int16)
+        
+        # Critical section covers only the ring write and flag update;
+        # conversion and logging happen outside the lock
         with self.tts_lock:
-            self.tts_buffer.extend(audio_data)
+            # Bounded occupancy: on overrun drop the oldest samples so
+            # live TTS stays in sync instead of accumulating latency
+            dropped = self.tts_ring.write_dropping_oldest(samples)
             self.is_tts_playing = True
-            print(
-                f"🎵 TTS QUEUED TO MIXER: {len(audio_data)} bytes "
-                f"(buffer now: {len(self.tts_buffer)} bytes, "
+            buffered_bytes = self.tts_ring.available() * 2
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"🎵 TTS audio queued: {len(audio_data)} bytes "
+                f"(total buffer: {buffered_bytes} bytes, "
                 f"is_running={self.is_running})"
             )
-            logger.info(
-                f"🎵 TTS audio queued: {len(audio_data)} bytes "
-                f"(total buffer: {len(self.tts_buffer)} bytes)"
+        if dropped:
+            logger.warning(
+                f"⚠️ TTS buffer overrun, dropped {dropped} oldest samples"
             )
     
     def is_tts_active(self) -> bool:
         """
         Check if TTS is currently playing/mixing.
         """
-        with self.tts_lock:
-            return self.is_tts_playing
+        return self.is_tts_playing or self.tts_ring.available() > 0
     
     def __del__(self):
         """Cleanup on deletion."""
         self.stop()
-        if hasattr(self, 'audio'):
-            self.audio.terminate()
 
 
 # Global mixer instance
@@ -2,27 +2,71 @@
 Enhanced audio recorder for capturing both microphone and system audio.
 """
 import pyaudio
-import io
-import wave
+import struct
 import threading
+import numpy as np
 from typing import Generator, Dict, List, Tuple, Optional
 
+from services.audio.audio_backend import get_device_table, get_pyaudio
+
+
+WAV_HEADER_SIZE = 44
+
+
+def _make_wav_header(channels: int, sample_rate: int, sample_width: int,
+                     data_size: int) -> bytes:
+    """
+    Build a canonical 44-byte PCM RIFF/WAVE header.
+    
+    Args:
+        channels: Number of interleaved channels
+        sample_rate: Frames per second
+        sample_width: Bytes per sample
+        data_size: Size of the PCM payload in bytes
+    """
+    block_align = channels * sample_width
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + data_size, b'WAVE',
+        b'fmt ', 16, 1, channels, sample_rate,
+        sample_rate * block_align, block_align, sample_width * 8,
+        b'data', data_size
+    )
+
 
 class AudioRecorder:
-    def __init__(self, sample_rate: int = 16000, chunk_size: int = 1024):
+    def __init__(self, sample_rate: int = 16000, chunk_size: int = 1024,
+                 audio: Optional[pyaudio.PyAudio] = None):
         """
         Initialize audio recorder.
         
         Args:
             sample_rate: Audio sample rate (Whisper works well with 16kHz)
             chunk_size: Audio chunk size for streaming
+            audio: PyAudio instance the caller opens its streams on, so
+                   device indices match it (None for the shared one)
         """
         self.sample_rate = sample_rate
         self.chunk_size = chunk_size
         self.audio_format = pyaudio.paInt16
         self.channels = 1  # Mono audio
         
-        self.p = pyaudio.PyAudio()
+        # Never terminated here (owned by the caller or shared)
+        self.p = audio if audio is not None else get_pyaudio()
+        # Only the two size fields change between recordings
+        self._wav_header_template = _make_wav_header(
+            self.channels, self.sample_rate,
+            self.p.get_sample_size(self.audio_format), 0
+        )
+    
+    def _get_device_table(self) -> List[Tuple[int, Dict, str]]:
+        """
+        Get the device table of this recorder's PyAudio instance.
+        
+        Returns:
+            List of (index, device_info, lower-cased name) tuples
+        """
+        return get_device_table(self.p)
         
     def list_audio_devices(self) -> List[Dict]:
         """
@@ -35,9 +79,7 @@ class AudioRecorder:
         default_input = self.p.get_default_input_device_info()
         default_output = self.p.get_default_output_device_info()
         
-        for i in range(self.p.get_device_count()):
-            device_info = self.p.get_device_info_by_index(i)
-            
+        for i, device_info, _ in self._get_device_table():
             # Include devices with input capability or useful output devices
             if (device_info['maxInputChannels'] > 0 or
                     device_info['maxOutputChannels'] > 0):
@@ -69,11 +111,13 @@ class AudioRecorder:
         Prioritizes: BlackHole -> SoundFlower -> Default Output
         """
         devices = self.list_audio_devices()
+        # Lower-cased names from the device table
+        lower_names = {i: name for i, _, name in self._get_device_table()}
         
         # Look for virtual audio cables first
         virtual_devices = ['blackhole', 'soundflower', 'loopback']
         for device in devices:
-            device_name = device['name'].lower()
+            device_name = lower_names[device['index']]
             if any(vd in device_name for vd in virtual_devices) and device['can_record']:
                 print(f"🔊 Found virtual audio device: {device['name']}")
                 return device['index']
@@ -90,7 +134,7 @@ class AudioRecorder:
         # Look for any device that mentions system/output audio
         system_keywords = ['system', 'output', 'speaker', 'headphone']
         for device in devices:
-            device_name = device['name'].lower()
+            device_name = lower_names[device['index']]
             if any(kw in device_name for kw in system_keywords) and device['can_record']:
                 print(f"🔊 Found system audio device: {device['name']}")
                 return device['index']
@@ -142,9 +186,6 @@ class AudioRecorder:
         Returns:
             Tuple of (mic_audio_bytes, system_audio_bytes)
         """
-        mic_frames = []
-        system_frames = []
-        
         # Set up microphone stream
         mic_stream = self.p.open(
             format=self.audio_format,
@@ -175,6 +216,14 @@ class AudioRecorder:
             self.sample_rate / self.chunk_size * duration
         )
         
+        # Preallocate contiguous PCM buffers (one row per chunk)
+        mic_pcm = self._alloc_pcm(frames_to_record)
+        mic_count = 0
+        system_pcm = (
+            self._alloc_pcm(frames_to_record) if system_stream else None
+        )
+        system_count = 0
+        
         print(f"🎤 Recording from both sources for {duration} seconds...")
         
         for _ in range(frames_to_record):
@@ -183,7 +232,8 @@ class AudioRecorder:
                 mic_data = mic_stream.read(
                     self.chunk_size, exception_on_overflow=False
                 )
-                mic_frames.append(mic_data)
+                mic_pcm[mic_count] = np.frombuffer(mic_data, dtype=np.int16)
+                mic_count += 1
             except Exception as e:
                 print(f"⚠️  Microphone read error: {e}")
                 
@@ -193,7 +243,10 @@ class AudioRecorder:
                     system_data = system_stream.read(
                         self.chunk_size, exception_on_overflow=False
                     )
-                    system_frames.append(system_data)
+                    system_pcm[system_count] = np.frombuffer(
+                        system_data, dtype=np.int16
+                    )
+                    system_count += 1
                 except Exception as e:
                     print(f"⚠️  System audio read error: {e}")
         
@@ -205,28 +258,48 @@ class AudioRecorder:
             system_stream.close()
         
         # Convert to WAV format
-        mic_audio = self._frames_to_wav(mic_frames)
-        if system_frames:
-            system_audio = self._frames_to_wav(system_frames)
+        if mic_count:
+            mic_audio = self._frames_to_wav([mic_pcm[:mic_count]])
+        else:
+            mic_audio = b""
+        if system_count:
+            system_audio = self._frames_to_wav([system_pcm[:system_count]])
         else:
             system_audio = b""
         
         return mic_audio, system_audio
+    
+    def _alloc_pcm(self, chunk_count: int) -> np.ndarray:
+        """Allocate an int16 buffer holding chunk_count audio chunks."""
+        return np.empty(
+            (chunk_count, self.chunk_size * self.channels), dtype=np.int16
+        )
         
     def _frames_to_wav(self, frames: List[bytes]) -> bytes:
-        """Convert audio frames to WAV format bytes."""
+        """
+        Convert audio frames to WAV format bytes.
+        Frames may be any bytes-like objects (e.g. numpy PCM buffers).
+        """
         if not frames:
             return b""
             
-        wav_buffer = io.BytesIO()
-        with wave.open(wav_buffer, 'wb') as wf:
-            wf.setnchannels(self.channels)
-            wf.setsampwidth(self.p.get_sample_size(self.audio_format))
-            wf.setframerate(self.sample_rate)
-            wf.writeframes(b''.join(frames))
-        
-        wav_buffer.seek(0)
-        return wav_buffer.read()
+        # Flat byte views, so numpy buffers are measured in bytes
+        views = [memoryview(f).cast('B') for f in frames]
+        total = sum(v.nbytes for v in views)
+        
+        # Header and payload go straight into one preallocated buffer
+        wav = bytearray(WAV_HEADER_SIZE + total)
+        wav[:WAV_HEADER_SIZE] = self._wav_header_template
+        struct.pack_into('<I', wav, 4, 36 + total)
+        struct.pack_into('<I', wav, WAV_HEADER_SIZE - 4, total)
+        
+        out = memoryview(wav)
+        offset = WAV_HEADER_SIZE
+        for view in views:
+            end = offset + view.nbytes
+            out[offset:end] = view
+            offset = end
+        return bytes(wav)
         
     def start_recording_stream(self) -> Generator[bytes, None, None]:
         """
@@ -274,31 +347,26 @@ class AudioRecorder:
             frames_per_buffer=self.chunk_size
         )
         
-        frames = []
         frames_to_record = int(
             self.sample_rate / self.chunk_size * duration_seconds
         )
+        # Single contiguous allocation instead of a list of chunks
+        pcm = self._alloc_pcm(frames_to_record)
         
         print(f"🎤 Recording for {duration_seconds} seconds...")
         
-        for _ in range(frames_to_record):
+        for i in range(frames_to_record):
             data = stream.read(self.chunk_size, exception_on_overflow=False)
-            frames.append(data)
+            pcm[i] = np.frombuffer(data, dtype=np.int16)
         
         stream.stop_stream()
         stream.close()
         
         # Convert to WAV format in memory
-        wav_buffer = io.BytesIO()
-        with wave.open(wav_buffer, 'wb') as wf:
-            wf.setnchannels(self.channels)
-            wf.setsampwidth(self.p.get_sample_size(self.audio_format))
-            wf.setframerate(self.sample_rate)
-            wf.writeframes(b''.join(frames))
-        
-        wav_buffer.seek(0)
-        return wav_buffer.read()
+        return self._frames_to_wav([pcm])
     
     def cleanup(self):
-        """Clean up PyAudio resources."""
-        self.p.terminate()
+        """
+        Clean up recorder resources.
+        PyAudio is released by its owner (the shared one at exit).
+        """
@@ -0,0 +1,141 @@
+"""
+Audio Ring Buffer: fixed-size single-producer/single-consumer PCM FIFO.
+
+Used by the audio mixer to hand TTS samples from the TTS thread
+(producer) to the realtime mixer thread (consumer) without locks:
+- Storage is a pre-allocated int16 numpy array (no per-chunk allocation)
+- The write index is only updated by the producer
+- The read index is only updated by the consumer
+- Indices grow monotonically; the storage position is index % capacity
+- On overrun the producer may drop the oldest samples by raising a
+  read floor before overwriting them; the consumer re-checks the floor
+  after each copy and discards samples overwritten while it copied
+"""
+
+import numpy as np
+
+
+class AudioRingBuffer:
+    """
+    Lock-free SPSC ring buffer of int16 samples.
+
+    Safe for exactly one producer thread and one consumer thread.
+    Plain int index assignment is atomic under the GIL, so each side
+    only ever publishes its own index after its copy is complete.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Initialize ring buffer.
+
+        Args:
+            capacity: Maximum number of int16 samples held at once
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._buffer = np.zeros(capacity, dtype=np.int16)
+        self._write_idx = 0  # Owned by producer
+        self._read_idx = 0  # Owned by consumer
+        self._read_floor = 0  # Raised by producer to drop oldest samples
+
+    def available(self) -> int:
+        """Number of samples ready to be read."""
+        return self._write_idx - max(self._read_idx, self._read_floor)
+
+    def free(self) -> int:
+        """Number of samples that can be written without overrun."""
+        return self.capacity - self.available()
+
+    def write(self, samples: np.ndarray) -> int:
+        """
+        Write samples into the ring (producer side).
+
+        Args:
+            samples: int16 samples to append
+
+        Returns:
+            Number of samples written (less than len(samples) if full)
+        """
+        count = min(len(samples), self.free())
+        if count <= 0:
+            return 0
+
+        start = self._write_idx % self.capacity
+        first = min(count, self.capacity - start)
+        self._buffer[start:start + first] = samples[:first]
+        if count > first:
+            # Wrap around to the beginning of storage
+            self._buffer[:count - first] = samples[first:count]
+
+        # Publish only after the copy is complete
+        self._write_idx += count
+        return count
+
+    def write_dropping_oldest(self, samples: np.ndarray) -> int:
+        """
+        Write all samples (producer side), dropping the oldest buffered
+        samples on overrun so occupancy (and latency) stays bounded.
+        The read floor is raised before the old slots are overwritten, so
+        a read that overlaps this write can detect the stale samples.
+
+        Args:
+            samples: int16 samples to append
+
+        Returns:
+            Number of samples dropped (0 if everything fit)
+        """
+        dropped = 0
+        if len(samples) > self.capacity:
+            # Only the newest capacity samples can ever be played
+            dropped = len(samples) - self.capacity
+            samples = samples[dropped:]
+
+        overflow = len(samples) - self.free()
+        if overflow > 0:
+            # Move the consumer past the oldest samples before they are
+            # overwritten
+            self._read_floor = self._write_idx + len(samples) - self.capacity
+            dropped += overflow
+
+        self.write(samples)
+        return dropped
+
+    def read_into(self, out: np.ndarray) -> int:
+        """
+        Read up to len(out) samples into out (consumer side).
+        Any part of out not covered by buffered samples is zero-filled.
+        Samples the producer dropped while they were being copied are
+        discarded, so out never mixes old and new audio.
+
+        Args:
+            out: Pre-allocated int16 destination array
+
+        Returns:
+            Number of buffered samples copied into out
+        """
+        read_idx = max(self._read_idx, self._read_floor)
+        count = min(len(out), self._write_idx - read_idx)
+
+        if count > 0:
+            start = read_idx % self.capacity
+            first = min(count, self.capacity - start)
+            out[:first] = self._buffer[start:start + first]
+            if count > first:
+                # Wrap around to the beginning of storage
+                out[first:count] = self._buffer[:count - first]
+
+        consumed = count
+        # A concurrent write_dropping_oldest may have overwritten the
+        # start of what was just copied; it raised the floor first
+        stale = min(count, self._read_floor - read_idx)
+        if stale > 0:
+            out[:count - stale] = out[stale:count]
+            count -= stale
+
+        if count < len(out):
+            out[count:] = 0
+
+        # Release the slots only after the copy is complete
+        self._read_idx = read_idx + consumed
+        return count
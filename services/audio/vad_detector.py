@@ -3,8 +3,8 @@ Voice Activity Detection (VAD) using WebRTC VAD.
 Detects when speech is present in audio to optimize transcription.
 """
 import webrtcvad
-from typing import Generator
-from config import VADSettings, AudioSettings
+from typing import Generator, Optional
+from config import SAMPLE_RATE, get_settings
 
 
 class VADDetector:
@@ -12,19 +12,21 @@ class VADDetector:
     
     def __init__(
         self,
-        sample_rate: int = AudioSettings.SAMPLE_RATE,
-        aggressiveness: int = VADSettings.AGGRESSIVENESS
+        sample_rate: int = SAMPLE_RATE,
+        aggressiveness: Optional[int] = None
     ):
         """
         Initialize VAD detector.
         
         Args:
             sample_rate: Audio sample rate (must be 8000, 16000, 32000, 48000)
-            aggressiveness: VAD aggressiveness (0-3)
+            aggressiveness: VAD aggressiveness (0-3, None for settings)
         """
+        if aggressiveness is None:
+            aggressiveness = get_settings().vad.aggressiveness
         self.sample_rate = sample_rate
         self.vad = webrtcvad.Vad(aggressiveness)
-        self.frame_duration_ms = VADSettings.FRAME_DURATION_MS
+        self.frame_duration_ms = get_settings().vad.frame_duration_ms
         
         # Calculate frame size
         self.frame_size = int(
@@ -87,7 +89,7 @@ class VADDetector:
     def get_speech_segments(
         self,
         audio_data: bytes,
-        min_speech_duration: float = VADSettings.MIN_SPEECH_DURATION
+        min_speech_duration: Optional[float] = None
     ) -> Generator[tuple[int, int], None, None]:
         """
         Get speech segments from audio data.
@@ -95,10 +97,14 @@ class VADDetector:
         Args:
             audio_data: Full audio data
             min_speech_duration: Minimum speech duration in seconds
+                                 (None for settings)
             
         Yields:
             Tuples of (start_byte, end_byte) for speech segments
         """
+        if min_speech_duration is None:
+            min_speech_duration = get_settings().vad.min_speech_duration
+        
         # Skip WAV header if present
         if audio_data[:4] == b'RIFF':
             audio_data = audio_data[44:]
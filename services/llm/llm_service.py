@@ -1,33 +1,38 @@
+import functools
 from openai import AzureOpenAI
 import config as cfg
 from typing import List, Dict, Optional
 from datetime import datetime
 
-# Initialize the AzureOpenAI client
-client = AzureOpenAI(
-    api_version=cfg.AzureOpenAI.OPENAI_API_VERSION,
-    azure_endpoint=cfg.AzureOpenAI.AZURE_OPENAI_ENDPOINT,  # type: ignore
-    api_key=cfg.AzureOpenAI.AZURE_OPENAI_API_KEY,
-)
+
+@functools.cache
+def get_client() -> AzureOpenAI:
+    """Create the AzureOpenAI client on first use (reads the settings)."""
+    settings = cfg.get_settings().openai
+    return AzureOpenAI(
+        api_version=settings.api_version,
+        azure_endpoint=settings.endpoint,  # type: ignore
+        api_key=settings.api_key,
+    )
 
 
 def list_models():
     """Get list of available models from Azure OpenAI."""
     try:
-        models = client.models.list()
+        models = get_client().models.list()
         model_names = [model.id for model in models.data]
         return model_names
     except Exception as e:
         print(f"Error listing models: {e}")
         # Return a default model if API call fails (for testing purposes)
-        return [cfg.AzureOpenAI.MODEL_NAME]
+        return [cfg.get_settings().openai.model_name]
 
 
 def chat(message: str, max_tokens: int = 300, temperature: float = 0.7) -> str:
     """Send a message to the LLM and get a response (legacy function for backward compatibility)."""
     try:
-        response = client.chat.completions.create(
-            model=cfg.AzureOpenAI.MODEL_NAME,
+        response = get_client().chat.completions.create(
+            model=cfg.get_settings().openai.model_name,
             messages=[
                 {"role": "system", "content": "You are a helpful AI meeting assistant. Provide concise, actionable responses that help improve meeting productivity and understanding."},
                 {"role": "user", "content": message}
@@ -171,8 +176,8 @@ def chat_with_memory(
         messages.append({"role": "user", "content": user_message})
         
         # Make API call
-        response = client.chat.completions.create(
-            model=cfg.AzureOpenAI.MODEL_NAME,
+        response = get_client().chat.completions.create(
+            model=cfg.get_settings().openai.model_name,
             messages=messages,
             max_tokens=max_tokens,
             temperature=temperature
@@ -1,6 +1,32 @@
 """
 Prompts for LLM-based translation and other text processing tasks.
 """
+import functools
+
+
+TRANSLATION_PROMPT_TEMPLATE = """Translate the following text to {target_language}. 
+Provide ONLY the translation without any explanations, notes, or additional text.
+
+Text to translate:
+{text}
+
+Translation:"""
+
+
+@functools.lru_cache(maxsize=8)
+def get_translation_template(target_language: str) -> str:
+    """
+    Get the translation prompt specialized for one target language.
+    
+    Args:
+        target_language: Target language name (e.g., "English", "Russian", "Turkish")
+    
+    Returns:
+        Prompt template whose only remaining placeholder is {text}
+    """
+    return TRANSLATION_PROMPT_TEMPLATE.replace(
+        "{target_language}", target_language
+    )
 
 
 def get_translation_prompt(text: str, target_language: str) -> str:
@@ -14,19 +40,33 @@ def get_translation_prompt(text: str, target_language: str) -> str:
     Returns:
         Formatted prompt for translation
     """
-    language_codes = {
-        "English": "en-US",
-        "Russian": "ru-RU",
-        "Turkish": "tr-TR"
-    }
+    return get_translation_template(target_language).format(text=text)
+
+
+def get_batch_translation_prompt(texts: list, target_language: str) -> str:
+    """
+    Generate one prompt that translates several texts at once.
     
-    prompt = f"""Translate the following text to {target_language}. 
-Provide ONLY the translation without any explanations, notes, or additional text.
+    Args:
+        texts: Texts to translate, in order
+        target_language: Target language name (e.g., "English", "Russian", "Turkish")
+    
+    Returns:
+        Formatted prompt asking for numbered translations ("1. ...")
+    """
+    # One line per text so the numbering stays unambiguous
+    numbered = "\n".join(
+        f"{i}. {' '.join(text.split())}" for i, text in enumerate(texts, 1)
+    )
+    
+    prompt = f"""Translate each numbered line below to {target_language}.
+Reply with exactly {len(texts)} numbered lines in the same order, formatted as "N. translation".
+Provide ONLY the translations without any explanations, notes, or additional text.
 
-Text to translate:
-{text}
+Lines to translate:
+{numbered}
 
-Translation:"""
+Translations:"""
     
     return prompt
 
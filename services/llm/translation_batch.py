@@ -0,0 +1,99 @@
+"""
+Batched translation: several texts translated in one LLM call.
+
+The texts are sent as one numbered prompt and the numbered reply is
+matched back to them. When the reply cannot be matched unambiguously,
+each text is translated with its own call instead.
+
+llm_service.chat reports failures as an "Error: ..." reply rather than
+raising; such replies raise TranslationError here, so they are never
+delivered (or spoken) as translations.
+"""
+import re
+from typing import Callable, List, Optional
+
+from services.llm import prompts
+
+
+# Most texts sent in one prompt
+TRANSLATION_BATCH_SIZE = 5
+
+_NUMBERED_LINE = re.compile(r'^\s*(\d+)[.)]\s*(.*)$')
+_ERROR_PREFIX = "Error:"
+
+
+class TranslationError(Exception):
+    """The LLM call failed; no translation is available."""
+
+
+def _checked_reply(reply: str) -> str:
+    """Return an LLM reply, raising TranslationError for error replies."""
+    if reply.startswith(_ERROR_PREFIX):
+        raise TranslationError(reply[len(_ERROR_PREFIX):].strip())
+    return reply
+
+
+def split_numbered_lines(response: str, count: int) -> Optional[List[str]]:
+    """
+    Split a numbered LLM reply ("1. ...", "2. ...") into its items.
+    
+    Text before the first numbered line (e.g. a "Translations:" header)
+    is ignored. An unnumbered line after it means an item spans several
+    lines, which cannot be matched reliably, so the reply is rejected.
+    
+    Args:
+        response: LLM reply text
+        count: Number of items expected
+    
+    Returns:
+        List of count items ordered by their numbers, or None if the
+        reply is not numbered exactly 1..count, one line per item
+    """
+    items = {}
+    for line in response.splitlines():
+        match = _NUMBERED_LINE.match(line)
+        if match:
+            number = int(match.group(1))
+            if number in items:
+                return None
+            items[number] = match.group(2).strip()
+        elif items and line.strip():
+            return None
+    if sorted(items) != list(range(1, count + 1)):
+        return None
+    return [items[i] for i in range(1, count + 1)]
+
+
+def translate_texts(
+    texts: List[str],
+    target_language: str,
+    chat: Callable[..., str]
+) -> List[str]:
+    """
+    Translate texts with as few LLM calls as possible.
+    
+    Args:
+        texts: Texts to translate, in order
+        target_language: Target language name
+        chat: LLM call, chat(prompt, max_tokens=...) -> reply text
+    
+    Returns:
+        Translations in the same order as texts
+    
+    Raises:
+        TranslationError: The LLM reported a failure. A failed batch is
+            not retried per text, so an outage costs one call, not N
+    """
+    if len(texts) > 1:
+        prompt = prompts.get_batch_translation_prompt(texts, target_language)
+        response = _checked_reply(chat(prompt, max_tokens=300 * len(texts)))
+        translations = split_numbered_lines(response, len(texts))
+        if translations is not None:
+            return translations
+        print("⚠️ Batch translation reply not numbered, "
+              "translating one by one")
+    
+    template = prompts.get_translation_template(target_language)
+    return [
+        _checked_reply(chat(template.format(text=text))) for text in texts
+    ]
@@ -2,14 +2,506 @@
 Azure Speech Service wrapper for real-time transcription
 with speaker diarization.
 """
-import azure.cognitiveservices.speech as speechsdk
-from config import AzureSpeechService
-from typing import Optional, Callable
+from __future__ import annotations
+
+import asyncio
+import atexit
+import functools
+import hashlib
+import logging
+import logging.handlers
+import queue
+import struct
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+import numpy as np
+from config import get_settings
+from typing import Dict, Optional, Callable, Tuple, Union
+
+try:
+    # Faster parsing of the detailed-format result JSON
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover - depends on environment
+    from json import loads as json_loads
+
+
+log = logging.getLogger(__name__)
+
+# azure.cognitiveservices.speech, bound by _load_sdk(). Importing it
+# loads the native Speech SDK, so it is deferred until a transcriber is
+# created; everything below that uses it runs after that point.
+speechsdk = None
+_preload_thread: Optional[threading.Thread] = None
+
+
+@functools.cache
+def _load_sdk():
+    """Import the Azure Speech SDK once and bind it to speechsdk."""
+    global speechsdk
+    if (_preload_thread is not None
+            and _preload_thread is not threading.current_thread()):
+        # Let a running preload finish instead of importing in parallel
+        _preload_thread.join()
+        if speechsdk is not None:
+            return speechsdk
+    import azure.cognitiveservices.speech as sdk
+    speechsdk = sdk
+    return sdk
+
+
+def preload_sdk():
+    """
+    Start importing the Azure Speech SDK on a background thread, so its
+    native library loads while the application finishes starting up.
+    Call early from an entry point; creating a transcriber waits for it.
+    """
+    global _preload_thread
+    if _preload_thread is None and speechsdk is None:
+        _preload_thread = threading.Thread(
+            target=_load_sdk, name="azure-sdk-preload", daemon=True
+        )
+        _preload_thread.start()
+
+
+def install_queue_logging(name: str = "services", level: int = logging.INFO):
+    """
+    Print the application's log records to stdout through a QueueHandler,
+    so SDK callback and audio threads only enqueue records; formatting
+    and console I/O happen on a QueueListener thread. Messages are plain
+    text, as the previous print() calls were.
+    
+    Opt-in: call once from an entry point. Skipped if the application
+    already configured handlers for the logger.
+    
+    Args:
+        name: Logger to attach to (default: all application services)
+        level: Minimum level printed
+    """
+    target = logging.getLogger(name)
+    if target.handlers:
+        return
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(records, console)
+    target.addHandler(logging.handlers.QueueHandler(records))
+    target.setLevel(level)
+    listener.start()
+    atexit.register(listener.stop)
+
+
+DEFAULT_SAMPLE_RATE = 16000  # All pushed audio is 16-bit mono PCM
+# Silence pushed after each batched clip so the service closes the
+# phrase (must exceed the segmentation silence timeout)
+BATCH_GAP_MS = 600
+BATCH_RESULT_TIMEOUT = 10.0  # seconds to wait for a batched result
+TICKS_PER_SECOND = 10_000_000  # Result offsets are in 100 ns ticks
+TEXT_CACHE_SIZE = 4096  # Recognized clips remembered by content hash
+# Clips quieter than this (int16 RMS) are not sent to Azure
+SILENCE_RMS_THRESHOLD = 200
+WAV_HEADER_SIZE = 44  # Canonical RIFF/fmt/data layout
+SPEAKER_CACHE_SIZE = 64  # Distinct speaker IDs memoized per session
+LANGUAGE_NAMES = {
+    "en-US": "🇺🇸 English",
+    "ru-RU": "🇷🇺 Russian",
+    "tr-TR": "🇹🇷 Turkish"
+}
+
+
+def _use_auto_detect() -> bool:
+    """
+    Whether recognition auto-detects the language. Read from the
+    settings when a recognizer is built, never at import time.
+    """
+    return get_settings().azure.speech_language == "auto"
+
+
+def _wav_pcm(audio_data: bytes) -> Tuple[bytes, int]:
+    """
+    Split a WAV clip into its PCM payload and sample rate.
+    Raw PCM is returned as is, at DEFAULT_SAMPLE_RATE.
+    
+    Clips from AudioRecorder use the canonical 44-byte header, which is
+    recognized without walking chunks; other layouts are parsed.
+    """
+    if audio_data[:4] != b'RIFF':
+        return audio_data, DEFAULT_SAMPLE_RATE
+    
+    # The fmt chunk directly follows the RIFF header
+    sample_rate = struct.unpack_from('<I', audio_data, 24)[0]
+    
+    chunk_id, size = struct.unpack_from('<4sI', audio_data, 36)
+    if chunk_id == b'data':
+        pcm = audio_data[WAV_HEADER_SIZE:WAV_HEADER_SIZE + size]
+        return pcm, sample_rate
+    
+    # Non-canonical header (e.g. LIST chunk): walk the RIFF chunks
+    offset = 12
+    while offset + 8 <= len(audio_data):
+        chunk_id, size = struct.unpack_from('<4sI', audio_data, offset)
+        offset += 8
+        if chunk_id == b'data':
+            return audio_data[offset:offset + size], sample_rate
+        offset += size + (size & 1)  # Chunks are word aligned
+    return b'', sample_rate
+
+
+def _pcm_stream(sample_rate: int = DEFAULT_SAMPLE_RATE):
+    """Push stream for 16-bit mono PCM at the given sample rate."""
+    return speechsdk.audio.PushAudioInputStream(
+        speechsdk.audio.AudioStreamFormat(
+            samples_per_second=sample_rate, bits_per_sample=16, channels=1
+        )
+    )
+
+
+def _open_connection(recognizer):
+    """
+    Open the recognizer's service connection ahead of the first audio,
+    so the TLS/websocket handshake overlaps with session setup instead
+    of delaying the first utterance. Best effort: the SDK connects on
+    its own if this fails.
+    
+    Returns:
+        The Connection (keep a reference so it stays open) or None
+    """
+    try:
+        connection = speechsdk.Connection.from_recognizer(recognizer)
+        connection.open(True)  # For continuous recognition
+        return connection
+    except Exception as e:
+        log.debug("Connection pre-warm not available: %s", e)
+        return None
+
+
+class _BatchWorker:
+    """
+    Streams queued clips through one long-lived SpeechRecognizer.
+    
+    Clips are written back to back, each followed by a short silence,
+    so the session (and its handshake) is shared by all of them. A
+    recognized phrase is routed to its clip by the phrase's offset in
+    the stream, which is where that clip's bytes were written.
+    """
+    
+    def __init__(self, speech_config, sample_rate: int = DEFAULT_SAMPLE_RATE):
+        self.speech_config = speech_config
+        self.sample_rate = sample_rate
+        self._gap_silence = bytes(2 * sample_rate * BATCH_GAP_MS // 1000)
+        self._ticks_per_byte = TICKS_PER_SECOND / (2 * sample_rate)
+        self._jobs: queue.Queue = queue.Queue()
+        # (job_id, start_tick, end_tick, future), in stream order
+        self._pending: deque = deque()
+        self._pending_lock = threading.Lock()
+        self._next_job_id = 0
+        self._recognizer = None
+        self._connection = None
+        self._stream = None
+        self._stream_pos = 0  # Bytes written into the current stream
+        # Set by SDK callbacks; the worker thread releases the session
+        self._session_ended = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    def submit(self, audio_data: bytes) -> Future:
+        """Queue a clip; the future resolves to its text or None."""
+        future = Future()
+        self._jobs.put((audio_data, future))
+        return future
+    
+    def close(self):
+        """Stop the worker thread and the recognizer."""
+        self._jobs.put(None)
+        self._thread.join(timeout=5.0)
+    
+    def _run(self):
+        """Worker thread: write queued clips into the shared stream."""
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            audio_data, future = job
+            try:
+                if self._session_ended:
+                    # Release the ended session before opening a new one
+                    self._stop()
+                if self._recognizer is None:
+                    self._start()
+                
+                start = self._stream_pos
+                self._stream_pos += len(audio_data) + len(self._gap_silence)
+                with self._pending_lock:
+                    job_id = self._next_job_id
+                    self._next_job_id += 1
+                    self._pending.append((
+                        job_id,
+                        start * self._ticks_per_byte,
+                        self._stream_pos * self._ticks_per_byte,
+                        future
+                    ))
+                self._stream.write(audio_data)
+                self._stream.write(self._gap_silence)
+            
+            except Exception as e:
+                log.warning("⚠️  Azure Speech transcription error: %s", e)
+                self._fail_pending()
+                if not future.done():
+                    future.set_result(None)
+                self._stop()
+        self._stop()
+    
+    def _start(self):
+        """Open a fresh recognizer session; offsets restart at zero."""
+        self._session_ended = False
+        self._stream = _pcm_stream(self.sample_rate)
+        self._stream_pos = 0
+        recognizer = speechsdk.SpeechRecognizer(
+            speech_config=self.speech_config,
+            audio_config=speechsdk.audio.AudioConfig(stream=self._stream)
+        )
+        recognizer.recognized.connect(self._handle_recognized)
+        recognizer.canceled.connect(self._handle_stopped)
+        recognizer.session_stopped.connect(self._handle_stopped)
+        self._connection = _open_connection(recognizer)
+        recognizer.start_continuous_recognition_async().get()
+        self._recognizer = recognizer
+    
+    def _stop(self):
+        """Close the current session, if any (worker thread only)."""
+        recognizer, connection = self._recognizer, self._connection
+        stream = self._stream
+        self._recognizer = None
+        self._connection = None
+        self._stream = None
+        self._session_ended = False
+        try:
+            if recognizer:
+                # This stop is ours; don't report it as a session end
+                recognizer.canceled.disconnect_all()
+                recognizer.session_stopped.disconnect_all()
+                recognizer.stop_continuous_recognition_async().get()
+                recognizer.recognized.disconnect_all()
+            if connection:
+                connection.close()
+            if stream:
+                stream.close()
+        except Exception as e:
+            log.warning("⚠️  Error closing batch recognizer: %s", e)
+        # Nothing written to the closed stream can be recognized now
+        self._fail_pending()
+    
+    def _handle_recognized(self, evt):
+        """Resolve the clip the phrase belongs to (first phrase wins)."""
+        text = None
+        if evt.result.reason == speechsdk.ResultReason.RecognizedSpeech:
+            text = evt.result.text or None
+        offset = evt.result.offset
+        
+        with self._pending_lock:
+            while self._pending:
+                job_id, start, end, future = self._pending[0]
+                if offset >= end:
+                    # Clip ended before this phrase: it had no speech
+                    self._pending.popleft()
+                    if not future.done():
+                        future.set_result(None)
+                    continue
+                if offset >= start and not future.done():
+                    future.set_result(text)
+                break
+    
+    def _handle_stopped(self, evt):
+        """
+        Session ended or failed: release every waiting clip and flag the
+        session, so the worker thread closes it before the next clip.
+        """
+        if (isinstance(evt, speechsdk.SpeechRecognitionCanceledEventArgs)
+                and evt.reason == speechsdk.CancellationReason.Error):
+            log.warning("⚠️  Azure Speech Error: %s", evt.error_details)
+        self._session_ended = True
+        self._fail_pending()
+    
+    def _fail_pending(self):
+        """Resolve all outstanding clips with None."""
+        with self._pending_lock:
+            while self._pending:
+                future = self._pending.popleft()[3]
+                if not future.done():
+                    future.set_result(None)
+
+
+class PacedPushStream:
+    """
+    PushAudioInputStream wrapper that caps writes at ~1x real time.
+    
+    Pushing a file faster than real time overflows the SDK's client
+    buffer and forces a reconnect. Live device input is already paced by
+    the device, so it can bypass the throttle (and must not block an
+    audio callback).
+    """
+    
+    # Let writes run this far ahead of real time before sleeping
+    LEAD_SECONDS = 0.05
+    # Progressive framing: the first frames are small so the service
+    # sees audio (and can return a partial) sooner, then frames double
+    FIRST_FRAME_MS = 20
+    MAX_FRAME_MS = 200
+    
+    def __init__(self, stream, bytes_per_second: int = 32000,
+                 bypass_pacing: bool = False):
+        """
+        Args:
+            stream: speechsdk.audio.PushAudioInputStream to wrap
+            bytes_per_second: PCM byte rate (16kHz 16-bit mono = 32000)
+            bypass_pacing: Write straight through (live sources)
+        """
+        self.stream = stream
+        self.bytes_per_second = bytes_per_second
+        self.bypass_pacing = bypass_pacing
+        self._next_allowed = 0.0  # monotonic time the audio so far ends
+        self._bytes_per_ms = bytes_per_second // 1000
+        self._next_frame_ms = self.FIRST_FRAME_MS
+    
+    def reset_progression(self):
+        """Start again from small frames (e.g. after an interruption)."""
+        self._next_frame_ms = self.FIRST_FRAME_MS
+    
+    def write(self, buffer):
+        """Push audio in progressively larger frames."""
+        if self._next_frame_ms >= self.MAX_FRAME_MS:
+            self._write_frame(buffer)
+            return
+        
+        # Plain slices: the SDK expects bytes, not memoryviews. Only the
+        # first few frames of a session take this path
+        offset = 0
+        while offset < len(buffer):
+            size = self._next_frame_ms * self._bytes_per_ms
+            self._write_frame(buffer[offset:offset + size])
+            offset += size
+            if self._next_frame_ms < self.MAX_FRAME_MS:
+                self._next_frame_ms = min(
+                    self.MAX_FRAME_MS, self._next_frame_ms * 2
+                )
+    
+    def _write_frame(self, buffer):
+        """Push one frame, sleeping first if it would exceed real time."""
+        if not self.bypass_pacing:
+            now = time.monotonic()
+            delay = self._next_allowed - now - self.LEAD_SECONDS
+            if delay > 0:
+                time.sleep(delay)
+            self._next_allowed = (
+                max(self._next_allowed, now)
+                + len(buffer) / self.bytes_per_second
+            )
+        self.stream.write(buffer)
+    
+    def close(self):
+        """Signal end of audio to the service."""
+        self.stream.close()
+
+
+class _CallbackDispatcher:
+    """
+    Runs result/interim callbacks on a worker thread.
+    
+    The SDK delivers events on its receive thread; a slow callback (UI,
+    logging, translation) there back-pressures the socket reader. SDK
+    handlers only post events here.
+    
+    Finals are delivered in order and never dropped. Interims are
+    coalesced: only the latest per speaker is kept (each supersedes the
+    previous one), delivered at most once per INTERIM_INTERVAL, and a
+    final discards its speaker's pending interim.
+    """
+    
+    FINAL = "final"
+    INTERIM = "interim"
+    INTERIM_INTERVAL = 0.05  # seconds between interim deliveries
+    
+    def __init__(self, result_callback: Optional[Callable],
+                 interim_callback: Optional[Callable]):
+        self.result_callback = result_callback
+        self.interim_callback = interim_callback
+        self._finals: deque = deque()
+        self._interims: dict = {}  # speaker -> latest interim event
+        self._next_interim = 0.0  # monotonic time of next interim flush
+        self._cond = threading.Condition()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    def post(self, kind: str, text: str, source_label: str, speaker: str):
+        """Queue an event from the SDK thread without blocking on it."""
+        event = (text, source_label, speaker)
+        with self._cond:
+            if kind == self.FINAL:
+                self._interims.pop(speaker, None)
+                self._finals.append(event)
+            else:
+                self._interims[speaker] = event
+            self._cond.notify()
+    
+    def stop(self):
+        """Deliver queued finals, then stop the worker thread."""
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        self._thread.join(timeout=5.0)
+    
+    def _next_batch(self):
+        """
+        Block until there is something to deliver.
+        
+        Returns:
+            (callback, events) or None when stopped and drained
+        """
+        with self._cond:
+            while True:
+                if self._finals:
+                    return self.result_callback, [self._finals.popleft()]
+                if not self._running:
+                    return None
+                if self._interims:
+                    now = time.monotonic()
+                    wait = self._next_interim - now
+                    if wait <= 0:
+                        self._next_interim = now + self.INTERIM_INTERVAL
+                        events = list(self._interims.values())
+                        self._interims.clear()
+                        return self.interim_callback, events
+                    self._cond.wait(wait)
+                else:
+                    self._cond.wait()
+    
+    def _run(self):
+        """Worker thread: invoke callbacks outside the lock."""
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            callback, events = batch
+            for text, source_label, speaker in events:
+                try:
+                    callback(text, source_label, speaker)
+                except Exception as e:
+                    log.warning(
+                        "⚠️  Error in transcription callback: %s", e
+                    )
 
 
 class AzureSpeechTranscriber:
     """Azure Speech Service transcriber with speaker diarization."""
     
+    # Built once per process and shared by every transcriber
+    _SPEECH_CONFIG = None
+    _AUTO_DETECT_CONFIG = None
+    _CONFIG_LOCK = threading.Lock()
+    
     def __init__(self, callback: Optional[Callable] = None, logger=None):
         """
         Initialize Azure Speech transcriber.
@@ -25,48 +517,123 @@ class AzureSpeechTranscriber:
         self.audio_stream = None
         self.is_streaming = False 
         self.current_language = None  # Track current detected language
-        self.last_result = None  # Track last result to avoid duplicates
+        # Keys of recent final results, to suppress repeated events
+        # for the same phrase (a phrase's stream offset is unique)
+        self._recent_result_hashes: deque = deque(maxlen=8)
+        self._dispatcher: Optional[_CallbackDispatcher] = None
+        self._connection = None  # Pre-opened service connection
+        
+        # Shared recognizer session for transcribe_audio_bytes
+        self._batch_workers: Dict[int, _BatchWorker] = {}  # by sample rate
+        self._batch_lock = threading.Lock()
+        
+        # LRU of audio digest -> recognized text, shared by sync/async paths
+        self._text_cache: OrderedDict[bytes, str] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
         self.initialize_config()
     
     def initialize_config(self):
-        """Initialize Azure Speech configuration."""
-        if not AzureSpeechService.AZURE_SPEECH_SERVICE_KEY:
-            raise ValueError(
-                "AZURE_SPEECH_SERVICE_KEY not set in environment variables"
+        """Initialize Azure Speech configuration (shared by all instances)."""
+        _load_sdk()
+        self.speech_config = type(self)._shared_speech_config()
+    
+    @classmethod
+    def _shared_speech_config(cls):
+        """
+        Build the SpeechConfig once per process with every property the
+        recognizers need; it is never modified afterwards.
+        """
+        with cls._CONFIG_LOCK:
+            if cls._SPEECH_CONFIG is not None:
+                return cls._SPEECH_CONFIG
+            
+            settings = get_settings().azure
+            if not settings.key:
+                raise ValueError(
+                    "AZURE_SPEECH_SERVICE_KEY not set in environment variables"
+                )
+            if not settings.region:
+                raise ValueError(
+                    "AZURE_SPEECH_SERVICE_REGION not set in environment "
+                    "variables"
+                )
+            
+            speech_config = speechsdk.SpeechConfig(
+                subscription=settings.key,
+                region=settings.region
             )
-        if not AzureSpeechService.AZURE_SPEECH_SERVICE_REGION:
-            raise ValueError(
-                "AZURE_SPEECH_SERVICE_REGION not set in environment variables"
+            
+            # Configure language detection/recognition
+            lang = settings.speech_language
+            if lang == "auto":
+                # Enable automatic language detection
+                log.info(
+                    "🌍 Auto language detection enabled (%s)",
+                    ", ".join(settings.candidate_languages)
+                )
+                # Auto-detect is configured per recognizer
+            else:
+                # Set specific language
+                speech_config.speech_recognition_language = lang
+                log.info("🌍 Language set to: %s", lang)
+            
+            # Enable detailed results for speaker diarization
+            speech_config.output_format = speechsdk.OutputFormat.Detailed
+            
+            # Request speaker diarization if enabled
+            if settings.enable_diarization:
+                speech_config.set_property(
+                    speechsdk.PropertyId
+                    .SpeechServiceConnection_LanguageIdMode,
+                    "Continuous"
+                )
+            
+            # Enable speaker diarization properties
+            # Note: Conversation Transcriber automatically enables diarization
+            # Configure speaker ranges using string properties
+            if settings.min_speakers:
+                speech_config.set_property_by_name("DiarizeGuests", "true")
+            if settings.max_speakers:
+                # Set expected speaker count for better accuracy
+                speech_config.set_property_by_name(
+                    "MaxSpeakers",
+                    str(settings.max_speakers)
+                )
+            
+            # Configure for faster interim results
+            # Reduce initial silence timeout for quicker response
+            speech_config.set_property(
+                speechsdk.PropertyId
+                .SpeechServiceConnection_InitialSilenceTimeoutMs,
+                "1500"
             )
-        
-        self.speech_config = speechsdk.SpeechConfig(
-            subscription=AzureSpeechService.AZURE_SPEECH_SERVICE_KEY,
-            region=AzureSpeechService.AZURE_SPEECH_SERVICE_REGION
-        )
-        
-        # Configure language detection/recognition
-        lang = AzureSpeechService.SPEECH_LANGUAGE
-        if lang == "auto":
-            # Enable automatic language detection
-            print("🌍 Auto language detection enabled "
-                  f"({', '.join(AzureSpeechService.CANDIDATE_LANGUAGES)})")
-            # Auto-detect will be configured per recognizer
-        else:
-            # Set specific language
-            self.speech_config.speech_recognition_language = lang
-            print(f"🌍 Language set to: {lang}")
-        
-        # Enable detailed results for speaker diarization
-        self.speech_config.output_format = (
-            speechsdk.OutputFormat.Detailed
-        )
-        
-        # Request speaker diarization if enabled
-        if AzureSpeechService.ENABLE_DIARIZATION:
-            self.speech_config.set_property(
-                speechsdk.PropertyId.SpeechServiceConnection_LanguageIdMode,
-                "Continuous"
+            speech_config.set_property(
+                speechsdk.PropertyId.Speech_SegmentationSilenceTimeoutMs,
+                "500"  # 500ms silence = faster segmentation
+            )
+            # Enable faster interim result updates
+            speech_config.set_property(
+                speechsdk.PropertyId
+                .SpeechServiceResponse_PostProcessingOption,
+                "TrueText"
             )
+            
+            cls._SPEECH_CONFIG = speech_config
+            return speech_config
+    
+    @classmethod
+    def _shared_auto_detect_config(cls):
+        """Build the candidate-language detection config once."""
+        with cls._CONFIG_LOCK:
+            if cls._AUTO_DETECT_CONFIG is None:
+                languages = list(get_settings().azure.candidate_languages)
+                cls._AUTO_DETECT_CONFIG = (
+                    speechsdk.languageconfig.AutoDetectSourceLanguageConfig(
+                        languages=languages
+                    )
+                )
+            return cls._AUTO_DETECT_CONFIG
     
     def transcribe_audio_bytes(
         self,
@@ -75,9 +642,11 @@ class AzureSpeechTranscriber:
     ) -> Optional[str]:
         """
         Transcribe audio bytes using Azure Speech Service.
+        Clips from all callers share one recognizer session (see
+        _BatchWorker); call close() when done.
         
         Args:
-            audio_data: WAV format audio bytes
+            audio_data: WAV (or raw 16kHz 16-bit mono PCM) audio bytes
             source_label: Label for the audio source
             
         Returns:
@@ -85,49 +654,196 @@ class AzureSpeechTranscriber:
         """
         if not audio_data or len(audio_data) < 1000:
             return None
+        pcm, sample_rate = _wav_pcm(audio_data)
+        return self.transcribe_pcm(pcm, sample_rate, source_label)
+    
+    def transcribe_pcm(
+        self,
+        pcm: Union[bytes, memoryview],
+        sample_rate: int = DEFAULT_SAMPLE_RATE,
+        source_label: str = "audio"
+    ) -> Optional[str]:
+        """
+        Transcribe raw audio, so producers can skip WAV encoding.
+        
+        Args:
+            pcm: Little-endian 16-bit mono PCM samples
+            sample_rate: Sample rate of pcm in Hz
+            source_label: Label for the audio source
+            
+        Returns:
+            Transcribed text or None if no speech detected
+        """
+        if self._is_silent(pcm):
+            return None
+        
+        key = self._audio_key(pcm, sample_rate)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        # The SDK copies from bytes only
+        if not isinstance(pcm, bytes):
+            pcm = bytes(pcm)
+        
+        with self._batch_lock:
+            worker = self._batch_workers.get(sample_rate)
+            if worker is None:
+                worker = _BatchWorker(self.speech_config, sample_rate)
+                self._batch_workers[sample_rate] = worker
+            future = worker.submit(pcm)
         
         try:
-            # Create audio stream from bytes
-            audio_stream = speechsdk.audio.PushAudioInputStream()
-            audio_config = speechsdk.audio.AudioConfig(
-                stream=audio_stream
-            )
+            text = future.result(timeout=BATCH_RESULT_TIMEOUT)
+        except FutureTimeout:
+            log.warning("⚠️  Azure Speech timeout for %s", source_label)
+            return None
+        self._cache_put(key, text)
+        return text
+    
+    async def transcribe_audio_bytes_async(
+        self,
+        audio_data: bytes,
+        source_label: str = "audio"
+    ) -> Optional[str]:
+        """
+        Transcribe audio bytes without blocking the event loop.
+        Each call uses its own recognizer, so many clips can be in flight:
+            await asyncio.gather(*(t.transcribe_audio_bytes_async(b)
+                                   for b in clips))
+        
+        Args:
+            audio_data: WAV (or raw 16kHz 16-bit mono PCM) audio bytes
+            source_label: Label for the audio source
             
-            # Create speech recognizer
-            speech_recognizer = speechsdk.SpeechRecognizer(
+        Returns:
+            Transcribed text or None if no speech detected
+        """
+        if not audio_data or len(audio_data) < 1000:
+            return None
+        # Only raw PCM is pushed; the stream format is set explicitly
+        pcm, sample_rate = _wav_pcm(audio_data)
+        if self._is_silent(pcm):
+            return None
+        
+        key = self._audio_key(pcm, sample_rate)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        
+        def resolve(text):
+            # Runs on the event loop; only the first outcome counts
+            if not fut.done():
+                fut.set_result(text)
+        
+        def handle_recognized(evt):
+            text = None
+            if evt.result.reason == speechsdk.ResultReason.RecognizedSpeech:
+                text = evt.result.text or None
+            loop.call_soon_threadsafe(resolve, text)
+        
+        def handle_canceled(evt):
+            if evt.reason == speechsdk.CancellationReason.Error:
+                log.warning("⚠️  Azure Speech Error [%s]: %s",
+                            source_label, evt.error_details)
+            loop.call_soon_threadsafe(resolve, None)
+        
+        def handle_stopped(evt):
+            # End of stream without a phrase
+            loop.call_soon_threadsafe(resolve, None)
+        
+        recognizer = None
+        try:
+            audio_stream = _pcm_stream(sample_rate)
+            audio_config = speechsdk.audio.AudioConfig(stream=audio_stream)
+            recognizer = speechsdk.SpeechRecognizer(
                 speech_config=self.speech_config,
                 audio_config=audio_config
             )
+            recognizer.recognized.connect(handle_recognized)
+            recognizer.canceled.connect(handle_canceled)
+            recognizer.session_stopped.connect(handle_stopped)
             
-            # Push audio data
-            audio_stream.write(audio_data)
+            # SDK futures block on get(); keep that off the event loop
+            start = recognizer.start_continuous_recognition_async
+            await loop.run_in_executor(None, lambda: start().get())
+            audio_stream.write(pcm)
             audio_stream.close()
             
-            # Perform recognition
-            result = speech_recognizer.recognize_once()
-            
-            if result.reason == speechsdk.ResultReason.RecognizedSpeech:
-                return result.text
-            elif result.reason == speechsdk.ResultReason.NoMatch:
-                return None
-            elif result.reason == speechsdk.ResultReason.Canceled:
-                cancellation = result.cancellation_details
-                if cancellation.reason == speechsdk.CancellationReason.Error:
-                    error_msg = cancellation.error_details
-                    print(f"⚠️  Azure Speech Error: {error_msg}")
-                return None
-            
-            return None
+            text = await fut
+            self._cache_put(key, text)
+            return text
             
         except Exception as e:
-            print(f"⚠️  Azure Speech transcription error: {e}")
+            log.warning("⚠️  Azure Speech transcription error: %s", e)
             return None
+        
+        finally:
+            if recognizer is not None:
+                # Fire and forget: the result is already in hand
+                recognizer.stop_continuous_recognition_async()
+    
+    @staticmethod
+    def _is_silent(pcm: bytes) -> bool:
+        """
+        Check whether a clip is too quiet to be worth a round trip.
+        
+        Args:
+            pcm: Raw 16-bit PCM audio bytes
+        """
+        count = len(pcm) // 2
+        if count <= 0:
+            return True
+        samples = np.frombuffer(
+            pcm, dtype=np.int16, count=count
+        ).astype(np.float32)
+        rms = np.sqrt(np.dot(samples, samples) / count)
+        return rms < SILENCE_RMS_THRESHOLD
+    
+    @staticmethod
+    def _audio_key(pcm: bytes, sample_rate: int) -> bytes:
+        """Content hash identifying a clip in the text cache."""
+        return hashlib.blake2b(
+            pcm, digest_size=16, person=sample_rate.to_bytes(4, 'little')
+        ).digest()
+    
+    def _cache_get(self, key: bytes) -> Optional[str]:
+        """Return cached text for a clip and mark it recently used."""
+        with self._cache_lock:
+            text = self._text_cache.get(key)
+            if text is not None:
+                self._text_cache.move_to_end(key)
+            return text
+    
+    def _cache_put(self, key: bytes, text: Optional[str]):
+        """
+        Remember recognized text for a clip, evicting the oldest entry.
+        Empty results are not cached, since they may be transient errors.
+        """
+        if not text:
+            return
+        with self._cache_lock:
+            self._text_cache[key] = text
+            self._text_cache.move_to_end(key)
+            if len(self._text_cache) > TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+    
+    def close(self):
+        """Release the shared session used by transcribe_audio_bytes."""
+        with self._batch_lock:
+            for worker in self._batch_workers.values():
+                worker.close()
+            self._batch_workers.clear()
     
     def start_continuous_recognition(
         self,
         source_label: str = "audio",
         result_callback: Optional[Callable] = None,
-        interim_callback: Optional[Callable] = None
+        interim_callback: Optional[Callable] = None,
+        pace_writes: bool = False
     ):
         """
         Start continuous conversation transcription with speaker diarization.
@@ -139,12 +855,14 @@ class AzureSpeechTranscriber:
                            Signature: callback(text, source_label, speaker_id)
             interim_callback: Function to call with partial results
                             Signature: callback(text, source_label, speaker_id)
+            pace_writes: Throttle writes to 1x real time; enable for file
+                        or buffered sources (live devices are already 1x)
         
         Returns:
             tuple: (audio_stream, transcriber) - use these to push audio
         """
         if self.is_streaming:
-            print("⚠️  Already streaming. Stop first.")
+            log.warning("⚠️  Already streaming. Stop first.")
             return None, None
         
         try:
@@ -155,61 +873,31 @@ class AzureSpeechTranscriber:
                 bits_per_sample=16,
                 channels=1
             )
-            self.audio_stream = speechsdk.audio.PushAudioInputStream(
+            push_stream = speechsdk.audio.PushAudioInputStream(
                 stream_format
             )
+            self.audio_stream = PacedPushStream(
+                push_stream, bypass_pacing=not pace_writes
+            )
             
             audio_config = speechsdk.audio.AudioConfig(
-                stream=self.audio_stream
+                stream=push_stream
             )
             
-            # Configure speech config for conversation transcription
-            lang = AzureSpeechService.SPEECH_LANGUAGE
-            
-            # Set language for transcription with multi-language support
-            if lang == "auto":
-                # Enable continuous language identification for multi-language
-                # This allows the transcriber to switch between languages
-                auto_detect_config = (
-                    speechsdk.languageconfig.AutoDetectSourceLanguageConfig(
-                        languages=AzureSpeechService.CANDIDATE_LANGUAGES
-                    )
+            # Multi-language support: the transcriber can switch between
+            # candidate languages (fixed language is set on speech_config)
+            use_auto_detect = _use_auto_detect()
+            if use_auto_detect:
+                auto_detect_config = type(self)._shared_auto_detect_config()
+                log.info(
+                    "🌍 Multi-language mode enabled: %s",
+                    ", ".join(get_settings().azure.candidate_languages)
                 )
-                print(f"🌍 Multi-language mode enabled: "
-                      f"{', '.join(AzureSpeechService.CANDIDATE_LANGUAGES)}")
             else:
                 auto_detect_config = None
-                self.speech_config.speech_recognition_language = lang
-            
-            # Enable speaker diarization properties
-            # Note: Conversation Transcriber automatically enables diarization
-            # Configure speaker ranges using string properties
-            if AzureSpeechService.MIN_SPEAKERS:
-                self.speech_config.set_property_by_name(
-                    "DiarizeGuests",
-                    "true"
-                )
-            if AzureSpeechService.MAX_SPEAKERS:
-                # Set expected speaker count for better accuracy
-                self.speech_config.set_property_by_name(
-                    "MaxSpeakers",
-                    str(AzureSpeechService.MAX_SPEAKERS)
-                )
-            
-            # Configure for faster interim results
-            # Reduce initial silence timeout for quicker response
-            self.speech_config.set_property(
-                speechsdk.PropertyId.Speech_SegmentationSilenceTimeoutMs,
-                "500"  # 500ms silence = faster segmentation
-            )
-            # Enable faster interim result updates
-            self.speech_config.set_property(
-                speechsdk.PropertyId.SpeechServiceResponse_PostProcessingOption,
-                "TrueText"
-            )
             
             # Create conversation transcriber with language detection
-            if lang == "auto" and auto_detect_config:
+            if auto_detect_config:
                 transcriber = speechsdk.transcription.ConversationTranscriber(
                     speech_config=self.speech_config,
                     audio_config=audio_config,
@@ -221,76 +909,104 @@ class AzureSpeechTranscriber:
                     audio_config=audio_config
                 )
             
+            # Speaker ID -> display name, memoized for this session
+            # (interim events repeat the same few IDs many times a second)
+            is_mic = "MIC" in source_label.upper()
+            speaker_display_cache = {}
+            
+            def format_speaker(speaker_id):
+                """Display name for a non-empty speaker ID."""
+                display = speaker_display_cache.get(speaker_id)
+                if display is None:
+                    if speaker_id.startswith("Guest-"):
+                        # Microphone is Speaker 0, others are 1, 2, 3...
+                        # ("Guest-1" -> "Speaker 1")
+                        display = ("Speaker 0" if is_mic
+                                   else "Speaker " + speaker_id[6:])
+                    else:
+                        display = speaker_id
+                    if len(speaker_display_cache) < SPEAKER_CACHE_SIZE:
+                        speaker_display_cache[speaker_id] = display
+                return display
+            
+            # Callbacks run off the SDK thread
+            dispatcher = _CallbackDispatcher(result_callback, interim_callback)
+            self._dispatcher = dispatcher
+            post = dispatcher.post
+            FINAL = _CallbackDispatcher.FINAL
+            INTERIM = _CallbackDispatcher.INTERIM
+            
             # Set up event handlers
-            def handle_transcribed(evt):
+            def handle_transcribed_fixed(evt):
                 """Handle final transcription results with speaker ID."""
                 reason = speechsdk.ResultReason.RecognizedSpeech
                 if evt.result.reason == reason:
                     speaker_id = evt.result.speaker_id
                     text = evt.result.text
                     
-                    # Deduplicate: check if this is the same as last result
-                    result_key = f"{speaker_id}:{text}"
-                    if result_key == self.last_result:
+                    # Deduplicate repeated events for the same phrase;
+                    # the offset keeps a legitimately repeated short
+                    # utterance ("yes", "okay") from being suppressed
+                    result_hash = hash(
+                        (evt.result.offset, speaker_id, text)
+                    )
+                    if result_hash in self._recent_result_hashes:
                         return  # Skip duplicate
-                    self.last_result = result_key
-                    
-                    # Try to detect language if available
-                    if lang == "auto":
-                        try:
-                            detected_lang = None
-                            # Try to get language from result properties
-                            if hasattr(evt.result, 'properties'):
-                                lang_property = (
-                                    evt.result.properties.get(
-                                        speechsdk.PropertyId
-                                        .SpeechServiceResponse_JsonResult
-                                    )
-                                )
-                                if lang_property:
-                                    import json
-                                    result_json = json.loads(lang_property)
-                                    detected_lang = result_json.get('Language')
-                            
-                            if detected_lang and detected_lang != self.current_language:
-                                self.current_language = detected_lang
-                                lang_map = {
-                                    "en-US": "🇺🇸 English",
-                                    "ru-RU": "🇷🇺 Russian",
-                                    "tr-TR": "🇹🇷 Turkish"
-                                }
-                                lang_name = lang_map.get(
-                                    detected_lang, detected_lang
-                                )
-                                print(
-                                    f"\n🌍 Language switched: "
-                                    f"{lang_name} [{source_label}]"
-                                )
-                                if self.logger:
-                                    self.logger.log_language_change(
-                                        detected_lang, source_label
-                                    )
-                        except Exception as e:
-                            # Language detection not available
-                            pass
+                    self._recent_result_hashes.append(result_hash)
                     
                     # Format speaker ID for display
-                    if speaker_id and speaker_id.startswith("Guest-"):
-                        # Extract number from "Guest-1", "Guest-2", etc.
-                        speaker_num = speaker_id.replace("Guest-", "")
-                        # Microphone is Speaker 0, others are 1, 2, 3...
-                        if "MIC" in source_label.upper():
-                            speaker_display = "Speaker 0"
-                        else:
-                            speaker_display = f"Speaker {speaker_num}"
-                    elif speaker_id:
-                        speaker_display = speaker_id
-                    else:
-                        speaker_display = "Unknown"
+                    speaker_display = (
+                        format_speaker(speaker_id) if speaker_id
+                        else "Unknown"
+                    )
                     
                     if result_callback and text:
                         # Pass speaker info to callback
-                        result_callback(text, source_label, speaker_display)
+                        post(FINAL, text, source_label, speaker_display)
+            
+            def track_language(result):
+                """Report a change of the detected language."""
+                try:
+                    # Language is only exposed in the detailed JSON result
+                    lang_property = result.properties.get(
+                        speechsdk.PropertyId.SpeechServiceResponse_JsonResult
+                    )
+                    if not lang_property:
+                        return
+                    detected_lang = json_loads(lang_property).get('Language')
+                    if (not detected_lang
+                            or detected_lang == self.current_language):
+                        return
+                    
+                    self.current_language = detected_lang
+                    lang_name = LANGUAGE_NAMES.get(
+                        detected_lang, detected_lang
+                    )
+                    log.info(
+                        "\n🌍 Language switched: %s [%s]",
+                        lang_name, source_label
+                    )
+                    if self.logger:
+                        self.logger.log_language_change(
+                            detected_lang, source_label
+                        )
+                except Exception:
+                    # Language detection not available
+                    pass
+            
+            def handle_transcribed_auto(evt):
+                """Final results in multi-language mode: track language."""
+                reason = speechsdk.ResultReason.RecognizedSpeech
+                if evt.result.reason == reason:
+                    track_language(evt.result)
+                handle_transcribed_fixed(evt)
+            
+            # Language mode is fixed per session: pick the handler once
+            # instead of branching on every event
+            handle_transcribed = (
+                handle_transcribed_auto if use_auto_detect
+                else handle_transcribed_fixed
+            )
             
             def handle_transcribing(evt):
                 """Handle interim results for live display."""
@@ -300,42 +1016,41 @@ class AzureSpeechTranscriber:
                     text = evt.result.text
                     
                     # Format speaker ID
-                    if speaker_id and speaker_id.startswith("Guest-"):
-                        speaker_num = speaker_id.replace("Guest-", "")
-                        # Microphone is Speaker 0, others are 1, 2, 3...
-                        if "MIC" in source_label.upper():
-                            speaker_display = "Speaker 0"
-                        else:
-                            speaker_display = f"Speaker {speaker_num}"
-                    elif speaker_id:
-                        speaker_display = speaker_id
-                    else:
-                        speaker_display = "..."
+                    speaker_display = (
+                        format_speaker(speaker_id) if speaker_id else "..."
+                    )
                     
                     if text:
-                        interim_callback(text, source_label, speaker_display)
+                        post(INTERIM, text, source_label, speaker_display)
             
             def handle_canceled(evt):
                 """Handle cancellation/errors."""
                 if evt.reason == speechsdk.CancellationReason.Error:
-                    print(f"⚠️  Transcription error: {evt.error_details}")
+                    log.warning("⚠️  Transcription error: %s",
+                                evt.error_details)
             
             # Connect event handlers
             transcriber.transcribed.connect(handle_transcribed)
             transcriber.transcribing.connect(handle_transcribing)
             transcriber.canceled.connect(handle_canceled)
             
+            # Handshake now, before the caller starts pushing audio
+            self._connection = _open_connection(transcriber)
+            
             # Start conversation transcription
             transcriber.start_transcribing_async().get()
             
             self.is_streaming = True
-            print(f"👥 Speaker diarization enabled for {source_label}")
+            log.info("👥 Speaker diarization enabled for %s", source_label)
             return self.audio_stream, transcriber
             
         except Exception as e:
-            print(f"⚠️  Error starting conversation transcription: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception(
+                "⚠️  Error starting conversation transcription: %s", e
+            )
+            if self._dispatcher is not None:
+                self._dispatcher.stop()
+                self._dispatcher = None
             return None, None
     
     def stop_continuous_recognition(self, transcriber):
@@ -352,7 +1067,20 @@ class AzureSpeechTranscriber:
                     self.audio_stream.close()
                 self.is_streaming = False
             except Exception as e:
-                print(f"⚠️  Error stopping transcription: {e}")
+                log.warning("⚠️  Error stopping transcription: %s", e)
+        
+        # Release the pre-opened service connection
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            try:
+                connection.close()
+            except Exception as e:
+                log.warning("⚠️  Error closing connection: %s", e)
+        
+        # Flush callbacks still queued from the last events
+        if self._dispatcher is not None:
+            self._dispatcher.stop()
+            self._dispatcher = None
     
     def transcribe_with_diarization(
         self,
@@ -363,31 +1091,33 @@ class AzureSpeechTranscriber:
         Transcribe audio with speaker diarization.
         
         Args:
-            audio_data: WAV format audio bytes
+            audio_data: WAV (or raw 16kHz 16-bit mono PCM) audio bytes
             source_label: Label for the audio source
             
         Returns:
-            List of tuples: [(speaker_id, text, start_time, end_time), ...]
+            List of tuples: [(speaker_id, text), ...]
         """
         if not audio_data or len(audio_data) < 1000:
             return []
         
+        pcm, sample_rate = _wav_pcm(audio_data)
+        if self._is_silent(pcm):
+            return []
+        
         try:
-            # For speaker diarization, we need to use conversation transcriber
-            # This requires audio file format
-            audio_config = speechsdk.audio.AudioConfig(
-                filename=None  # We'll use push stream
-            )
-            
-            # Create conversation transcriber
+            # Conversation transcriber over a push stream holding the clip
+            audio_stream = _pcm_stream(sample_rate)
             conversation_transcriber = (
                 speechsdk.transcription.ConversationTranscriber(
                     speech_config=self.speech_config,
-                    audio_config=audio_config
+                    audio_config=speechsdk.audio.AudioConfig(
+                        stream=audio_stream
+                    )
                 )
             )
             
             results = []
+            done = threading.Event()
             
             def handle_result(evt):
                 """Handle transcription result with speaker info."""
@@ -397,26 +1127,35 @@ class AzureSpeechTranscriber:
                     text = evt.result.text
                     results.append((speaker_id, text))
             
+            def handle_stopped(evt):
+                """End of the clip (or an error): stop waiting."""
+                done.set()
+            
             # Subscribe to events
             conversation_transcriber.transcribed.connect(handle_result)
+            conversation_transcriber.session_stopped.connect(handle_stopped)
+            conversation_transcriber.canceled.connect(handle_stopped)
             
-            # Start transcription
+            # Push the whole clip; closing the stream ends the session
+            # once the service has processed it
             conversation_transcriber.start_transcribing_async().get()
+            audio_stream.write(pcm)
+            audio_stream.close()
             
-            # Wait for completion (simplified for now)
-            # In production, this would be more sophisticated
-            
+            if not done.wait(BATCH_RESULT_TIMEOUT):
+                log.warning(
+                    "⚠️  Speaker diarization timeout for %s", source_label
+                )
             conversation_transcriber.stop_transcribing_async().get()
             
             return results
             
         except Exception as e:
-            print(f"⚠️  Speaker diarization error: {e}")
+            log.warning("⚠️  Speaker diarization error: %s", e)
             # Fall back to simple transcription
-            simple_result = self.transcribe_audio_bytes(
-                audio_data, source_label
+            simple_result = self.transcribe_pcm(
+                pcm, sample_rate, source_label
             )
             if simple_result:
                 return [("Unknown", simple_result)]
             return []
-
@@ -3,13 +3,18 @@ TTS Audio Buffer
 Generates TTS audio using Azure Speech Service and buffers it in memory.
 Supports async generation and controlled playback.
 """
-import azure.cognitiveservices.speech as speechsdk
 from typing import Optional, Callable
 from threading import Lock, Thread
-from config import AzureSpeechService
+from config import get_settings
+from services.speech_engine.azure_speech_service import _load_sdk
 from .tts_voice_manager import TTSVoiceManager
 
 
+# azure.cognitiveservices.speech, bound when the first buffer is created
+# (see azure_speech_service._load_sdk: importing it loads the native SDK)
+speechsdk = None
+
+
 class TTSAudioBuffer:
     """
     Generates TTS audio and buffers it in memory.
@@ -18,6 +23,9 @@ class TTSAudioBuffer:
     
     def __init__(self):
         """Initialize TTS audio buffer."""
+        global speechsdk
+        speechsdk = _load_sdk()
+        
         self.voice_manager = TTSVoiceManager()
         
         # Audio buffer
@@ -29,9 +37,10 @@ class TTSAudioBuffer:
         self.generation_lock = Lock()
         
         # Azure Speech config
+        azure = get_settings().azure
         self.speech_config = speechsdk.SpeechConfig(
-            subscription=AzureSpeechService.AZURE_SPEECH_SERVICE_KEY,
-            region=AzureSpeechService.AZURE_SPEECH_SERVICE_REGION
+            subscription=azure.key,
+            region=azure.region
         )
         
         # Default voice
@@ -0,0 +1,118 @@
+"""
+Tests for the audio mixer's int16 mixing kernels and TTS ring buffer.
+"""
+import numpy as np
+import pytest
+
+from services.audio import audio_kernels
+from services.audio.audio_ring_buffer import AudioRingBuffer
+
+
+INT16_EDGES = np.array(
+    [-32768, -32767, -16385, -16384, -1, 0, 1, 16383, 16384, 32766, 32767],
+    dtype=np.int16
+)
+
+MIX_IMPLEMENTATIONS = [
+    audio_kernels._mix_mono_tts_stereo_loop,
+    audio_kernels._mix_mono_tts_stereo_numpy,
+    audio_kernels.mix_mono_tts_stereo,
+]
+
+
+def _edge_pairs():
+    """Every (mic, tts) combination of int16 edge values."""
+    mic = np.repeat(INT16_EDGES, len(INT16_EDGES))
+    tts_mono = np.tile(INT16_EDGES, len(INT16_EDGES))
+    tts = np.repeat(tts_mono, 2)  # Interleaved stereo
+    return mic, tts
+
+
+class TestMixKernel:
+    """Test cases for mix_mono_tts_stereo."""
+
+    @pytest.mark.parametrize("mix", MIX_IMPLEMENTATIONS)
+    def test_halving_add_never_overflows(self, mix):
+        """(a >> 1) + (b >> 1) stays within int16 for all edge pairs."""
+        mic, tts = _edge_pairs()
+        out = np.empty(len(tts), dtype=np.int16)
+
+        mix(mic, tts, out, 1)
+
+        # Reference computed without any chance of wrap-around
+        expected = (mic.astype(np.int32) >> 1) + (tts[0::2].astype(np.int32) >> 1)
+        assert expected.min() >= -32768
+        assert expected.max() <= 32767
+        assert np.array_equal(out[0::2], expected)
+        assert np.array_equal(out[1::2], expected)
+
+    @pytest.mark.parametrize("mix", MIX_IMPLEMENTATIONS)
+    def test_shift_zero_is_passthrough(self, mix):
+        """With silent TTS and shift 0, mic is duplicated unscaled."""
+        mic = INT16_EDGES
+        tts = np.zeros(len(mic) * 2, dtype=np.int16)
+        out = np.empty_like(tts)
+
+        mix(mic, tts, out, 0)
+
+        assert np.array_equal(out[0::2], mic)
+        assert np.array_equal(out[1::2], mic)
+
+
+class TestAudioRingBuffer:
+    """Test cases for AudioRingBuffer."""
+
+    def test_read_wraps_and_zero_pads(self):
+        """Reads wrap around storage and zero-fill past the data."""
+        ring = AudioRingBuffer(8)
+        out = np.empty(4, dtype=np.int16)
+
+        ring.write(np.arange(6, dtype=np.int16))
+        ring.read_into(out)
+        ring.write(np.arange(10, 15, dtype=np.int16))
+
+        assert ring.read_into(out) == 4
+        assert out.tolist() == [4, 5, 10, 11]
+        assert ring.read_into(out) == 3
+        assert out.tolist() == [12, 13, 14, 0]
+        assert ring.available() == 0
+
+    def test_write_dropping_oldest_keeps_newest(self):
+        """Overrun drops the oldest samples and keeps occupancy bounded."""
+        ring = AudioRingBuffer(4)
+        out = np.empty(4, dtype=np.int16)
+
+        ring.write(np.arange(3, dtype=np.int16))
+        dropped = ring.write_dropping_oldest(np.arange(10, 13, dtype=np.int16))
+
+        assert dropped == 2
+        assert ring.available() == 4
+        ring.read_into(out)
+        assert out.tolist() == [2, 10, 11, 12]
+
+    def test_overrun_during_read_discards_stale_prefix(self):
+        """Samples overwritten while being copied are not returned."""
+        ring = AudioRingBuffer(8)
+        ring.write(np.arange(8, dtype=np.int16))
+
+        class OverrunOnCopy(np.ndarray):
+            """Lets the producer overrun right as the consumer copies."""
+            fired = False
+
+            def __setitem__(self, key, value):
+                if not OverrunOnCopy.fired:
+                    OverrunOnCopy.fired = True
+                    ring.write_dropping_oldest(
+                        np.array([100, 101], dtype=np.int16)
+                    )
+                super().__setitem__(key, value)
+
+        out = np.empty(4, dtype=np.int16).view(OverrunOnCopy)
+
+        # Slots 0 and 1 now hold 100, 101: only 2, 3 are still valid
+        assert ring.read_into(out) == 2
+        assert out.tolist() == [2, 3, 0, 0]
+
+        rest = np.empty(8, dtype=np.int16)
+        assert ring.read_into(rest) == 6
+        assert rest.tolist() == [4, 5, 6, 7, 100, 101, 0, 0]
@@ -0,0 +1,69 @@
+"""
+Tests for the audio recorder's in-memory WAV encoding.
+"""
+import io
+import wave
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pyaudio")
+
+from services.audio.audio_recorder import AudioRecorder, _make_wav_header
+
+
+SAMPLE_RATE = 16000
+SAMPLE_WIDTH = 2
+
+
+def _recorder(channels):
+    """AudioRecorder with only the WAV state set (no PortAudio)."""
+    recorder = AudioRecorder.__new__(AudioRecorder)
+    recorder.channels = channels
+    recorder.sample_rate = SAMPLE_RATE
+    recorder._wav_header_template = _make_wav_header(
+        channels, SAMPLE_RATE, SAMPLE_WIDTH, 0
+    )
+    return recorder
+
+
+def _wave_reference(channels, pcm):
+    """The same PCM written by the standard library wave module."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav_file:
+        wav_file.setnchannels(channels)
+        wav_file.setsampwidth(SAMPLE_WIDTH)
+        wav_file.setframerate(SAMPLE_RATE)
+        wav_file.writeframes(pcm)
+    return buffer.getvalue()
+
+
+class TestFramesToWav:
+    """Test cases for AudioRecorder._frames_to_wav."""
+
+    @pytest.mark.parametrize("channels", [1, 2])
+    def test_matches_wave_module(self, channels):
+        """Output is byte-identical to what wave writes."""
+        chunks = [
+            np.arange(i * 256, (i + 1) * 256, dtype=np.int16)
+            for i in range(3)
+        ]
+        pcm = b"".join(chunk.tobytes() for chunk in chunks)
+
+        wav = _recorder(channels)._frames_to_wav(chunks)
+
+        assert isinstance(wav, bytes)
+        assert wav == _wave_reference(channels, pcm)
+
+    def test_mixed_frame_types(self):
+        """bytes and numpy frames are concatenated in order."""
+        frames = [b"\x01\x00\x02\x00", np.array([3, 4], dtype=np.int16)]
+
+        wav = _recorder(1)._frames_to_wav(frames)
+
+        pcm = b"\x01\x00\x02\x00" + frames[1].tobytes()
+        assert wav == _wave_reference(1, pcm)
+
+    def test_no_frames(self):
+        """No frames yields empty bytes rather than a bare header."""
+        assert _recorder(1)._frames_to_wav([]) == b""
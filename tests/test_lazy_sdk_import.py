@@ -0,0 +1,52 @@
+"""
+Tests that importing the application does not load the Azure Speech SDK.
+
+The SDK's native library is loaded in the background by preload_sdk()
+once the entry point runs; an eager import anywhere on the import path
+would block start-up on it instead.
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SDK_MODULE = "azure.cognitiveservices.speech"
+
+
+def _sdk_loaded_after_import(module: str) -> bool:
+    """Import module in a fresh interpreter; report if the SDK got loaded."""
+    code = (
+        f"import sys, {module}; "
+        f"print({SDK_MODULE!r} in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip() == "True"
+
+
+class TestLazySdkImport:
+    """Importing entry points must leave the Speech SDK unloaded."""
+
+    @pytest.mark.parametrize("module", [
+        "services.speech_engine.azure_speech_service",
+        "services.speech_engine.tts.tts_audio_buffer",
+    ])
+    def test_speech_modules_import(self, module):
+        """Speech services bind the SDK only when first used."""
+        assert not _sdk_loaded_after_import(module)
+
+    def test_gui_app_import(self):
+        """gui_app (and the TTS controller it imports) stays SDK-free."""
+        pytest.importorskip("PyQt6")
+        pytest.importorskip("pyaudio")
+        assert not _sdk_loaded_after_import("gui_app")
+
+    def test_main_import(self):
+        """The console entry point stays SDK-free."""
+        pytest.importorskip("pyaudio")
+        assert not _sdk_loaded_after_import("main")
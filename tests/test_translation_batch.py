@@ -0,0 +1,114 @@
+"""
+Tests for batched translation reply parsing and its per-text fallback.
+"""
+import pytest
+
+from services.llm.translation_batch import (
+    TranslationError, split_numbered_lines, translate_texts
+)
+
+
+class FakeChat:
+    """LLM stand-in that replays canned replies and records prompts."""
+
+    def __init__(self, replies):
+        self.replies = list(replies)
+        self.prompts = []
+
+    def __call__(self, prompt, max_tokens=300):
+        self.prompts.append(prompt)
+        return self.replies.pop(0)
+
+
+class TestSplitNumberedLines:
+    """Test cases for split_numbered_lines."""
+
+    def test_splits_in_order(self):
+        """Header and blank lines are ignored."""
+        reply = "Translations:\n1. Hello\n\n2) World\n"
+        assert split_numbered_lines(reply, 2) == ["Hello", "World"]
+
+    def test_reordered_numbering(self):
+        """Items are returned by number, not by reply position."""
+        reply = "2. World\n1. Hello"
+        assert split_numbered_lines(reply, 2) == ["Hello", "World"]
+
+    def test_count_mismatch(self):
+        """Missing or extra items reject the reply."""
+        assert split_numbered_lines("1. Hello", 2) is None
+        assert split_numbered_lines("1. a\n2. b\n3. c", 2) is None
+
+    def test_duplicate_number(self):
+        """A number used twice rejects the reply."""
+        assert split_numbered_lines("1. a\n1. b\n2. c", 2) is None
+
+    def test_multi_line_item(self):
+        """An unnumbered continuation line rejects the reply."""
+        reply = "1. First line\nsecond line\n2. World"
+        assert split_numbered_lines(reply, 2) is None
+
+
+class TestTranslateTexts:
+    """Test cases for translate_texts."""
+
+    def test_batch_reply_used(self):
+        """A well-formed reply needs a single LLM call."""
+        chat = FakeChat(["1. Hola\n2. Mundo"])
+
+        result = translate_texts(["Hello", "World"], "Spanish", chat)
+
+        assert result == ["Hola", "Mundo"]
+        assert len(chat.prompts) == 1
+
+    def test_falls_back_per_text(self):
+        """An unmatched reply is retried with one call per text."""
+        chat = FakeChat(["1. Hola\ncontinued\n2. Mundo", "Hola", "Mundo"])
+
+        result = translate_texts(["Hello", "World"], "Spanish", chat)
+
+        assert result == ["Hola", "Mundo"]
+        assert len(chat.prompts) == 3
+        assert "Hello" in chat.prompts[1]
+        assert "World" in chat.prompts[2]
+
+    def test_single_text_not_batched(self):
+        """One text goes straight to the single-text prompt."""
+        chat = FakeChat(["Hola"])
+
+        assert translate_texts(["Hello"], "Spanish", chat) == ["Hola"]
+        assert "numbered" not in chat.prompts[0]
+
+    def test_batch_error_reply_not_retried(self):
+        """An error reply raises without per-text fallback calls."""
+        chat = FakeChat(["Error: boom"])
+
+        with pytest.raises(TranslationError, match="boom"):
+            translate_texts(["Hello", "World"], "Spanish", chat)
+        assert len(chat.prompts) == 1
+
+    def test_single_error_reply_not_delivered(self):
+        """A per-text error reply is never returned as a translation."""
+        chat = FakeChat(["Error: boom"])
+
+        with pytest.raises(TranslationError):
+            translate_texts(["Hello"], "Spanish", chat)
+
+    def test_fallback_stops_at_error_reply(self):
+        """The per-text fallback stops at the first error reply."""
+        chat = FakeChat(["not numbered", "Error: boom", "Mundo"])
+
+        with pytest.raises(TranslationError):
+            translate_texts(["Hello", "World"], "Spanish", chat)
+        assert len(chat.prompts) == 2
+
+    def test_chat_exception_not_retried(self):
+        """A raising chat call propagates without fallback calls."""
+        calls = []
+
+        def chat(prompt, max_tokens=300):
+            calls.append(prompt)
+            raise ConnectionError("offline")
+
+        with pytest.raises(ConnectionError):
+            translate_texts(["Hello", "World"], "Spanish", chat)
+        assert len(calls) == 1